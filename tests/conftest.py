@@ -0,0 +1,9 @@
+"""
+Shared test configuration for the workplace relations scraper.
+"""
+
+import os
+
+# Settings and logging snapshot the environment on import, so keep test runs
+# from writing log files before any project module is loaded
+os.environ.setdefault("LOGGING_ENABLED", "false")
@@ -0,0 +1,65 @@
+"""
+Tests for the BaseRepository default query methods.
+"""
+
+from workplace_relations.repositories.base_repository import BaseRepository
+
+
+class _ListRepository(BaseRepository[dict]):
+    """Repository implementing only the abstract methods, over a list."""
+
+    def __init__(self, entities):
+        self.entities = entities
+
+    def create(self, entity):
+        self.entities.append(entity)
+        return entity
+
+    def find_by_id(self, entity_id):
+        return self.find_by_field("id", entity_id)
+
+    def find_all(self, filters=None):
+        filters = filters or {}
+        return (
+            entity
+            for entity in self.entities
+            if all(entity.get(key) == value for key, value in filters.items())
+        )
+
+    def update(self, entity):
+        return entity
+
+    def delete(self, entity_id):
+        return False
+
+    def exists(self, entity_id):
+        return self.find_by_id(entity_id) is not None
+
+
+def _repository():
+    return _ListRepository(
+        [{"id": str(n), "body": "a" if n % 2 else "b"} for n in range(5)]
+    )
+
+
+def test_find_by_field_returns_first_match():
+    repository = _repository()
+
+    assert repository.find_by_field("body", "a") == {"id": "1", "body": "a"}
+    assert repository.find_by_field("body", "c") is None
+    assert repository.exists_by_field("id", "4")
+
+
+def test_count_streams_results():
+    repository = _repository()
+
+    assert repository.count() == 5
+    assert repository.count({"body": "a"}) == 2
+
+
+def test_find_paginated_returns_requested_page():
+    page = _repository().find_paginated(page=2, page_size=2)
+
+    assert [entity["id"] for entity in page["data"]] == ["2", "3"]
+    assert page["total_count"] == 5
+    assert page["total_pages"] == 3
@@ -0,0 +1,54 @@
+"""
+Tests for DocumentService HTML processing.
+"""
+
+from unittest import mock
+
+import pytest
+
+from workplace_relations.core.services.document_service import DocumentService
+
+
+@pytest.fixture
+def service():
+    return DocumentService(storage_service=mock.Mock())
+
+
+def test_extracts_content_div(service):
+    page = (
+        b"<html><head><title>t</title></head><body><nav>menu</nav>"
+        b'<div class="row col-sm-9"><p>Decision text</p></div></body></html>'
+    )
+
+    assert service._process_html_content(page) == (
+        b'<div class="row col-sm-9"><p>Decision text</p></div>'
+    )
+
+
+def test_falls_back_to_body_without_content_div(service):
+    page = b"<html><body><p>Only body</p></body></html>"
+
+    assert service._process_html_content(page) == b"<body><p>Only body</p></body>"
+
+
+def test_keeps_text_of_non_utf8_page(service):
+    # libxml2 does not recognise the "latin-1" label, so the page must not be
+    # left to lxml's own charset detection
+    page = (
+        '<html><head><meta charset="latin-1"></head><body>'
+        '<div class="col-sm-9"><p>Café décision</p></div></body></html>'
+    ).encode("latin-1")
+
+    result = service._process_html_content(page)
+
+    assert result == '<div class="col-sm-9"><p>Café décision</p></div>'.encode()
+
+
+def test_returns_original_when_extract_has_no_text(service):
+    page = b'<html><body><div class="col-sm-9"><p> </p></div></body></html>'
+
+    assert service._process_html_content(page) == page
+
+
+def test_non_html_content_is_unchanged(service):
+    assert service._process_content(b"%PDF-1.4", "pdf") == b"%PDF-1.4"
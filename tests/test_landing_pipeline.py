@@ -0,0 +1,144 @@
+"""
+Tests for LandingPipeline batched MongoDB writes and source URL tracking.
+"""
+
+from datetime import date
+from unittest import mock
+
+import pytest
+
+from workplace_relations.items import WorkplaceRelationsRecord
+from workplace_relations.pipelines import landing_pipeline
+
+
+@pytest.fixture
+def pipeline():
+    with mock.patch.object(landing_pipeline, "StorageService"):
+        pipeline = landing_pipeline.LandingPipeline()
+    pipeline.mongo_collection = mock.Mock()
+    pipeline.repository = mock.Mock()
+    yield pipeline
+    pipeline._write_pool.shutdown(wait=True)
+
+
+def _documents(*numbers):
+    return [
+        {"identifier": f"ADJ-{n}", "link_to_doc": f"https://example.com/{n}"}
+        for n in numbers
+    ]
+
+
+def test_written_batch_marks_urls_seen(pipeline):
+    for url in ("https://example.com/1", "https://example.com/2"):
+        assert not pipeline._is_known_url(url)
+
+    pipeline._write_documents(_documents(1, 2))
+
+    assert pipeline._claimed_urls == set()
+    assert pipeline._seen_urls == {"https://example.com/1", "https://example.com/2"}
+
+
+def test_failed_batch_releases_urls_for_retry(pipeline):
+    assert not pipeline._is_known_url("https://example.com/1")
+    pipeline.mongo_collection.bulk_write.side_effect = RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        pipeline._write_documents(_documents(1))
+
+    assert pipeline._seen_urls == set()
+    assert not pipeline._is_known_url("https://example.com/1")
+
+
+def test_failed_background_write_is_logged_with_identifiers(pipeline):
+    pipeline.batch_size = 2
+    pipeline.mongo_collection.bulk_write.side_effect = RuntimeError("down")
+    document = mock.Mock()
+    document.to_dict.side_effect = _documents(1, 2)
+
+    pipeline._store_in_mongodb(document)
+    pipeline._store_in_mongodb(document)
+    with mock.patch.object(pipeline, "logger") as logger:
+        pipeline._cleanup_pipeline(mock.Mock())
+
+    logger.error.assert_called_once_with(
+        "Failed to store 2 documents in MongoDB (down): ADJ-1, ADJ-2"
+    )
+    assert pipeline._write_futures == []
+
+
+def _record(number):
+    return WorkplaceRelationsRecord(
+        identifier=f"ADJ-{number}",
+        body="Adjudication",
+        partition_date="2024-01",
+        published_date="01/01/2024",
+        link_to_doc=f"https://example.com/{number}",
+    )
+
+
+def test_preload_loads_urls_for_crawl_months(pipeline):
+    spider = mock.Mock()
+    spider.config.start_date = date(2024, 1, 15)
+    spider.config.end_date = date(2024, 3, 1)
+    pipeline.repository.find_field_values.return_value = iter(
+        ["https://example.com/1", None]
+    )
+
+    pipeline._preload_known_urls(spider)
+
+    pipeline.repository.find_field_values.assert_called_once_with(
+        "link_to_doc", {"partition_date": {"$gte": "2024-01", "$lte": "2024-03"}}
+    )
+    assert pipeline._seen_urls == {"https://example.com/1"}
+
+
+def test_preload_failure_leaves_urls_unknown(pipeline):
+    pipeline.repository.find_field_values.side_effect = RuntimeError("down")
+
+    pipeline._preload_known_urls(mock.Mock())
+
+    assert pipeline._seen_urls == set()
+
+
+def test_known_url_is_skipped_without_download(pipeline):
+    pipeline._seen_urls.add("https://example.com/1")
+    item = _record(1)
+
+    assert pipeline._process_item(item, mock.Mock()) is item
+
+    pipeline.storage_service.download_and_store_document.assert_not_called()
+    assert item.file_path is None
+
+
+def test_claimed_url_is_skipped(pipeline):
+    assert not pipeline._is_known_url("https://example.com/1")
+
+    assert pipeline._is_known_url("https://example.com/1")
+
+
+def test_failed_download_releases_url(pipeline):
+    pipeline.storage_service.download_and_store_document.return_value = None
+
+    pipeline._process_item(_record(1), mock.Mock())
+
+    assert pipeline._claimed_urls == set()
+    assert pipeline._seen_urls == set()
+    assert pipeline._pending_documents == []
+
+
+def test_stored_document_keeps_url_claimed_until_written(pipeline):
+    pipeline.flush_interval = float("inf")
+    pipeline.storage_service.download_and_store_document.return_value = {
+        "file_path": "storage/ADJ-1.html",
+        "file_hash": "abc",
+        "file_type": "html",
+    }
+    item = _record(1)
+
+    pipeline._process_item(item, mock.Mock())
+
+    assert item.file_path == "storage/ADJ-1.html"
+    assert pipeline._claimed_urls == {"https://example.com/1"}
+    pipeline._flush_documents()
+    assert pipeline._claimed_urls == set()
+    assert pipeline._seen_urls == {"https://example.com/1"}
@@ -0,0 +1,119 @@
+"""
+Tests for MongoRepository writes and queries against a mocked collection.
+"""
+
+from datetime import date, datetime
+from unittest import mock
+
+import pytest
+from pymongo import ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from workplace_relations.core.models import Document
+from workplace_relations.repositories import mongo_repository
+
+
+@pytest.fixture
+def repository():
+    with mock.patch.object(mongo_repository, "get_mongo_client"):
+        repository = mongo_repository.MongoRepository("processed")
+    repository.collection = mock.Mock()
+    repository.collection.update_one.return_value.matched_count = 1
+    return repository
+
+
+def _document(identifier="ADJ-1", **values):
+    return Document(identifier=identifier, body="Adjudication", **values)
+
+
+def test_update_without_prior_read_sets_every_field(repository):
+    document = _document(description="new")
+
+    repository.update(document)
+
+    repository.collection.update_one.assert_called_once_with(
+        {"identifier": "ADJ-1"}, {"$set": document.to_dict()}
+    )
+
+
+def test_update_after_read_sets_only_changed_fields(repository):
+    stored = _document(description="old").to_dict()
+    repository.collection.find_one.return_value = dict(stored)
+    document = repository.find_by_id("ADJ-1")
+    document.description = "new"
+
+    repository.update(document)
+
+    repository.collection.update_one.assert_called_once_with(
+        {"identifier": "ADJ-1"}, {"$set": {"description": "new"}}
+    )
+
+
+def test_update_without_changes_does_not_write(repository):
+    repository.collection.find_one.return_value = _document().to_dict()
+
+    repository.update(repository.find_by_id("ADJ-1"))
+
+    repository.collection.update_one.assert_not_called()
+
+
+def test_upsert_many_replaces_by_identifier_in_batches(repository):
+    documents = [_document(f"ADJ-{n}") for n in range(3)]
+    repository.collection.bulk_write.side_effect = [
+        mock.Mock(upserted_count=1, matched_count=1),
+        mock.Mock(upserted_count=1, matched_count=0),
+    ]
+
+    assert repository.upsert_many(documents, batch_size=2) == (2, 1)
+
+    batches = [call.args[0] for call in repository.collection.bulk_write.call_args_list]
+    assert batches == [
+        [
+            ReplaceOne({"identifier": d.identifier}, d.to_dict(), upsert=True)
+            for d in documents[:2]
+        ],
+        [ReplaceOne({"identifier": "ADJ-2"}, documents[2].to_dict(), upsert=True)],
+    ]
+
+
+def test_upsert_many_counts_partial_batch_failures(repository):
+    repository.collection.bulk_write.side_effect = BulkWriteError(
+        {"nUpserted": 1, "nMatched": 0, "writeErrors": [{"index": 1, "errmsg": "x"}]}
+    )
+
+    assert repository.upsert_many([_document("ADJ-1"), _document("ADJ-2")]) == (1, 0)
+
+
+def test_create_many_continues_past_failed_inserts(repository):
+    repository.collection.insert_many.side_effect = [
+        BulkWriteError({"nInserted": 1, "writeErrors": [{"index": 1, "errmsg": "x"}]}),
+        mock.Mock(inserted_ids=[1]),
+    ]
+    documents = [_document(f"ADJ-{n}") for n in range(3)]
+
+    assert repository.create_many(documents, batch_size=2) == 2
+    assert repository.collection.insert_many.call_count == 2
+
+
+def test_find_by_date_range_queries_published_dt_with_legacy_fallback(repository):
+    repository.collection.find.return_value = iter([])
+
+    list(repository.find_by_date_range(date(2024, 1, 1), date(2024, 1, 31)))
+
+    query = repository.collection.find.call_args.args[0]
+    indexed, legacy = query["$or"]
+    assert indexed == {
+        "published_dt": {"$gte": datetime(2024, 1, 1), "$lte": datetime(2024, 1, 31)}
+    }
+    assert legacy["published_dt"] is None
+    parsed = legacy["$expr"]["$let"]["vars"]["parsed_date"]["$dateFromString"]
+    assert parsed["dateString"] == "$published_date"
+    assert parsed["format"] == "%d/%m/%Y"
+    assert parsed["onError"] is None
+
+
+def test_find_by_date_range_reraises_cursor_errors(repository):
+    repository.collection.find.side_effect = RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        list(repository.find_by_date_range(date(2024, 1, 1), date(2024, 1, 31)))
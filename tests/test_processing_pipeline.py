@@ -0,0 +1,108 @@
+"""
+Tests for ProcessingPipeline batched MongoDB writes.
+"""
+
+from unittest import mock
+
+import pytest
+from pymongo import ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from workplace_relations.core.models import Document
+from workplace_relations.items import WorkplaceRelationsRecord
+from workplace_relations.pipelines import processing_pipeline
+
+
+@pytest.fixture
+def pipeline():
+    with mock.patch.object(processing_pipeline, "DocumentService"):
+        pipeline = processing_pipeline.ProcessingPipeline()
+    pipeline.mongo_collection = mock.Mock()
+    return pipeline
+
+
+def test_flush_upserts_documents_keyed_on_identifier(pipeline):
+    pipeline._pending_documents = [
+        {"identifier": "ADJ-1", "body": "a"},
+        {"identifier": "ADJ-2", "body": "b"},
+    ]
+
+    pipeline._flush_documents()
+
+    requests = pipeline.mongo_collection.bulk_write.call_args.args[0]
+    assert requests == [
+        ReplaceOne(
+            {"identifier": "ADJ-1"}, {"identifier": "ADJ-1", "body": "a"}, upsert=True
+        ),
+        ReplaceOne(
+            {"identifier": "ADJ-2"}, {"identifier": "ADJ-2", "body": "b"}, upsert=True
+        ),
+    ]
+    assert pipeline.mongo_collection.bulk_write.call_args.kwargs == {"ordered": False}
+    assert pipeline._pending_documents == []
+
+
+def test_flush_without_pending_documents_does_not_write(pipeline):
+    pipeline._flush_documents()
+
+    pipeline.mongo_collection.bulk_write.assert_not_called()
+
+
+def test_flush_reports_partial_failures_without_raising(pipeline):
+    pipeline._pending_documents = [{"identifier": "ADJ-1"}, {"identifier": "ADJ-2"}]
+    pipeline.mongo_collection.bulk_write.side_effect = BulkWriteError(
+        {
+            "nUpserted": 1,
+            "nMatched": 0,
+            "writeErrors": [{"index": 1, "errmsg": "boom"}],
+        }
+    )
+
+    with mock.patch.object(pipeline, "logger") as logger:
+        pipeline._flush_documents()
+
+    logger.error.assert_called_once_with("Stored 1 of 2 processed documents; 1 failed")
+    logger.warning.assert_called_once_with("Failed to store document ADJ-2: boom")
+
+
+def test_flush_raises_other_errors(pipeline):
+    pipeline._pending_documents = [{"identifier": "ADJ-1"}]
+    pipeline.mongo_collection.bulk_write.side_effect = RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        pipeline._flush_documents()
+
+
+def test_store_flushes_once_batch_is_full(pipeline):
+    pipeline.batch_size = 2
+    pipeline.flush_interval = float("inf")
+    document = mock.Mock()
+    document.to_dict.side_effect = [{"identifier": "ADJ-1"}, {"identifier": "ADJ-2"}]
+
+    pipeline._store_processed_document(document)
+    pipeline.mongo_collection.bulk_write.assert_not_called()
+
+    pipeline._store_processed_document(document)
+    assert len(pipeline.mongo_collection.bulk_write.call_args.args[0]) == 2
+
+
+def test_processed_document_fields_are_set_on_item(pipeline):
+    item = WorkplaceRelationsRecord(identifier="ADJ-1", file_path="landing/ADJ-1.html")
+    document = Document(
+        identifier="ADJ-1",
+        file_path="processed/ADJ-1.html",
+        file_hash="abc",
+        original_file_path="landing/ADJ-1.html",
+        processed_at="2024-01-01T00:00:00",
+        processing_version="1.0",
+    )
+
+    with mock.patch.object(pipeline, "logger") as logger:
+        pipeline._update_item_from_processed_document(item, document)
+
+    logger.error.assert_not_called()
+    assert item.file_path == "processed/ADJ-1.html"
+    assert item.file_hash == "abc"
+    assert item.original_file_path == "landing/ADJ-1.html"
+    assert item.processed_at == "2024-01-01T00:00:00"
+    assert item.processing_version == "1.0"
@@ -0,0 +1,92 @@
+"""
+Tests for StorageService streamed downloads.
+"""
+
+import hashlib
+import os
+from unittest import mock
+
+import pytest
+
+from workplace_relations.core.models import Document
+from workplace_relations.core.services import storage_service
+from workplace_relations.core.services.storage_service import (
+    LocalFileStorageStrategy,
+    StorageService,
+)
+
+
+@pytest.fixture
+def service(tmp_path):
+    with mock.patch.object(StorageService, "_load_url_cache", return_value={}):
+        service = StorageService(strategy=LocalFileStorageStrategy())
+    service.storage_config = {
+        **service.storage_config,
+        "storage_base": str(tmp_path / "landing"),
+        "normalize_html": False,
+    }
+    service._url_cache_path = str(tmp_path / ".url_cache.json")
+    return service
+
+
+def _document(identifier="ADJ-1"):
+    return Document(
+        identifier=identifier,
+        body="Adjudication",
+        partition_date="2024-01",
+        link_to_doc=f"https://example.com/{identifier}.pdf",
+    )
+
+
+def _respond(*chunks):
+    """Patch the shared session to stream chunks (or raise an exception)."""
+    response = mock.MagicMock(status_code=200)
+    response.headers = {"content-type": "application/pdf"}
+
+    def iter_content(chunk_size):
+        for chunk in chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    response.iter_content.side_effect = iter_content
+    response.__enter__.return_value = response
+    return mock.patch.object(storage_service._SESSION, "get", return_value=response)
+
+
+def _files(root):
+    return sorted(
+        os.path.relpath(os.path.join(path, name), root)
+        for path, _, names in os.walk(root)
+        for name in names
+    )
+
+
+def test_download_streams_body_to_storage(service, tmp_path):
+    with _respond(b"%PDF-", b"1.4"):
+        info = service.download_and_store_document(_document())
+
+    assert info["file_type"] == "pdf"
+    assert info["file_hash"] == hashlib.sha256(b"%PDF-1.4").hexdigest()
+    with open(info["file_path"], "rb") as f:
+        assert f.read() == b"%PDF-1.4"
+    assert _files(tmp_path / "landing") == [
+        os.path.relpath(info["file_path"], tmp_path / "landing")
+    ]
+
+
+def test_interrupted_download_leaves_no_files(service, tmp_path):
+    with _respond(b"%PDF-", ConnectionError("reset")):
+        assert service.download_and_store_document(_document()) is None
+
+    assert _files(tmp_path / "landing") == []
+
+
+def test_known_content_is_linked_not_rewritten(service, tmp_path):
+    with _respond(b"%PDF-1.4"):
+        first = service.download_and_store_document(_document("ADJ-1"))
+    with _respond(b"%PDF-1.4"):
+        second = service.download_and_store_document(_document("ADJ-2"))
+
+    assert os.path.samefile(first["file_path"], second["file_path"])
+    assert len(_files(tmp_path / "landing")) == 2
@@ -5,12 +5,31 @@ Project constants and configuration values.
 # Storage Configuration
 STORAGE_BASE = "storage"
 PROCESSED_STORAGE_BASE = "processed_storage"
+STORAGE_FSYNC = False
+DROP_PAGE_CACHE = False
+NORMALIZE_HTML = False
+WRITE_CHUNK_SIZE = 64 * 1024  # 64 KiB
+URL_CACHE_FILENAME = ".url_cache.json"
+STORAGE_IO_WORKERS = 4
 
 # MongoDB Configuration
 MONGO_URI = "mongodb://localhost:27017"
 MONGO_DATABASE = "workplace_relations"
 MONGO_LANDING_COLLECTION = "landing_zone"
 MONGO_PROCESSED_COLLECTION = "processed_documents"
+MONGO_BATCH_SIZE = 200
+MONGO_FLUSH_INTERVAL = 5.0  # seconds before a partial batch is written
+MONGO_CURSOR_BATCH_SIZE = 1000  # documents fetched per cursor round trip
+MONGO_MAX_POOL_SIZE = 50
+MONGO_MIN_POOL_SIZE = 5
+MONGO_MAX_IDLE_TIME_MS = 60_000
+MONGO_COMPRESSORS = "zlib"  # e.g. "zstd,zlib" with pymongo[zstd] installed
+# Write concern "w" values; landing writes are unacknowledged since the
+# downloaded files on disk are canonical and can be re-indexed. With w=0 a
+# lost landing write goes unnoticed, so the landing pipeline's known-URL skip
+# is best-effort: such a document is simply downloaded again next crawl
+MONGO_LANDING_WRITE_CONCERN = 0
+MONGO_PROCESSED_WRITE_CONCERN = 1
 
 # Scrapy Configuration
 BOT_NAME = "workplace_relations"
@@ -29,6 +48,12 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 CONCURRENT_REQUESTS = 16
 CONCURRENT_REQUESTS_PER_DOMAIN = 8
 DOWNLOAD_DELAY = 1.5
+DOWNLOAD_TIMEOUT = 30
+
+# HTTP cache for listing pages, for repeated runs over the same date range
+HTTPCACHE_ENABLED = False
+HTTPCACHE_DIR = "httpcache"
+HTTPCACHE_EXPIRATION_SECS = 7 * 24 * 60 * 60
 
 # File Processing
 SUPPORTED_FILE_TYPES = {
@@ -44,4 +69,4 @@ DATE_FORMAT_DISPLAY = "%d/%m/%Y"
 DATE_FORMAT_PARTITION = "%Y-%m"
 
 # Processing Configuration
-PROCESSING_VERSION = "1.0"
+PROCESSING_VERSION = "1.1"
@@ -2,27 +2,157 @@
 Logging configuration for the workplace relations scraper.
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Mapping, Optional
+
+from .settings import _ENV
+
+
+class _LazyFileHandler(logging.Handler):
+    """
+    Rotating file handler that defers opening the log file until the first
+    record is emitted.
+    """
+
+    def __init__(self, log_file: str, max_bytes: int, backup_count: int):
+        super().__init__()
+        self.log_file = log_file
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._handler: Optional[RotatingFileHandler] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._handler is None:
+            log_dir = os.path.dirname(self.log_file)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            self._handler = RotatingFileHandler(
+                self.log_file,
+                maxBytes=self.max_bytes,
+                backupCount=self.backup_count,
+                encoding="utf-8",
+            )
+            self._handler.setFormatter(self.formatter)
+        self._handler.emit(record)
+
+    def close(self) -> None:
+        if self._handler is not None:
+            self._handler.close()
+        super().close()
 
 
 class LoggingConfig:
     """Configuration class for logging setup."""
 
-    def __init__(self):
-        self.enabled = os.environ.get("LOGGING_ENABLED", "true").lower() == "true"
-        self.level = os.environ.get("LOG_LEVEL", "INFO").upper()
-        self.log_dir = os.environ.get("LOG_DIR", "logs")
-        self.log_file = os.path.join(self.log_dir, "workplace_relations.log")
+    def __init__(self, env: Mapping[str, str]):
+        self._load_settings(env)
         self.max_bytes = 5 * 1024 * 1024  # 5 MB
         self.backup_count = 5
         self.log_format = "%(asctime)s | %(levelname)s | %(name)s | %(module)s:%(lineno)d | %(message)s"
         self.date_format = "%Y-%m-%d %H:%M:%S"
+        # Loggers only enqueue records; one background listener writes them
+        # to the shared file and console handlers
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._listener: Optional[QueueListener] = None
+        self._lock = threading.Lock()
+
+    def _load_settings(self, env: Mapping[str, str]) -> None:
+        """Read the logging settings from an environment mapping."""
+        self.enabled = env.get("LOGGING_ENABLED", "true").lower() == "true"
+        self.level = env.get("LOG_LEVEL", "INFO").upper()
+        self.log_dir = env.get("LOG_DIR", "logs")
+        self.log_file = os.path.join(self.log_dir, "workplace_relations.log")
 
-        # Create logs directory if logging is enabled
-        if self.enabled and not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
+    def reload(self, env: Mapping[str, str]) -> None:
+        """
+        Re-read the logging settings from an environment mapping.
+
+        Configured loggers pick up the new level, and a running listener is
+        restarted so records go to the new log file. LOGGING_ENABLED only
+        affects loggers created after the reload.
+        """
+        with self._lock:
+            self._load_settings(env)
+            if self._listener is not None:
+                self._stop_listener()
+                self._start_listener()
+        for logger in logging.Logger.manager.loggerDict.values():
+            if isinstance(logger, logging.Logger) and any(
+                isinstance(handler, QueueHandler) for handler in logger.handlers
+            ):
+                logger.setLevel(self.level)
+
+    def _start_listener(self) -> None:
+        """Start a listener writing queued records to fresh handlers."""
+        formatter = logging.Formatter(self.log_format, datefmt=self.date_format)
+
+        # File handler with rotation, opened on first emitted record
+        file_handler = _LazyFileHandler(
+            self.log_file, self.max_bytes, self.backup_count
+        )
+        file_handler.setFormatter(formatter)
+
+        # Console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+
+        self._listener = QueueListener(self._queue, file_handler, console_handler)
+        self._listener.start()
+
+    def _stop_listener(self) -> None:
+        """Write out queued records and close the listener's handlers."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    def _get_queue(self) -> queue.SimpleQueue:
+        """Return the log record queue, starting its listener on first use."""
+        with self._lock:
+            if self._queue is None:
+                self._queue = queue.SimpleQueue()
+                atexit.register(self.shutdown)
+                # The listener thread does not survive fork: drain the queue
+                # before forking so no record is written twice, then restart
+                # the listener on both sides
+                if hasattr(os, "register_at_fork"):
+                    os.register_at_fork(
+                        before=self._pause_listener,
+                        after_in_parent=self._resume_listener,
+                        after_in_child=self._resume_listener_in_child,
+                    )
+            if self._listener is None:
+                self._start_listener()
+            return self._queue
+
+    def _pause_listener(self) -> None:
+        """Write out queued records and stop the listener thread."""
+        self._lock.acquire()
+        if self._listener is not None:
+            self._listener.stop()
+
+    def _resume_listener(self) -> None:
+        """Restart the listener thread paused before a fork."""
+        if self._listener is not None:
+            self._listener.start()
+        self._lock.release()
+
+    def _resume_listener_in_child(self) -> None:
+        """Start the listener in a forked child, with a fresh lock."""
+        self._lock = threading.Lock()
+        if self._listener is not None:
+            self._listener.start()
+
+    def shutdown(self) -> None:
+        """Write out queued records and close the handlers."""
+        with self._lock:
+            self._stop_listener()
 
     def get_logger(self, name: str) -> logging.Logger:
         """Get a configured logger instance."""
@@ -34,28 +164,14 @@ class LoggingConfig:
 
         if not logger.handlers:  # Avoid duplicate handlers
             logger.setLevel(self.level)
-            formatter = logging.Formatter(self.log_format, datefmt=self.date_format)
-
-            # File handler with rotation
-            file_handler = RotatingFileHandler(
-                self.log_file,
-                maxBytes=self.max_bytes,
-                backupCount=self.backup_count,
-                encoding="utf-8",
-            )
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-
-            # Console handler
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            logger.addHandler(QueueHandler(self._get_queue()))
 
         return logger
 
 
-# Global logging configuration instance
-_logging_config = LoggingConfig()
+# Global logging configuration instance, read from the same environment
+# snapshot as settings; Settings.refresh() reloads it
+_logging_config = LoggingConfig(_ENV)
 
 
 def get_logger(name: str) -> logging.Logger:
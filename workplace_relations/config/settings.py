@@ -3,30 +3,23 @@ Centralized settings management for the workplace relations scraper.
 """
 
 import os
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from .constants import *
 
+# Snapshot of the process environment, treated as immutable after startup.
+_ENV: Dict[str, str] = dict(os.environ)
+
 
 class Settings:
     """
     Centralized settings management class.
-    Implements the Singleton pattern for consistent configuration access.
+    Constructed once as the module-level ``settings`` instance; import that
+    rather than instantiating the class again.
     """
 
-    _instance: Optional["Settings"] = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
     def __init__(self):
-        if self._initialized:
-            return
-
         self._load_settings()
-        self._initialized = True
 
     def _load_settings(self):
         """Load all settings from constants and environment variables."""
@@ -36,37 +29,79 @@ class Settings:
         self.NEWSPIDER_MODULE = NEWSPIDER_MODULE
 
         # Storage settings
-        self.STORAGE_BASE = os.environ.get("STORAGE_BASE", STORAGE_BASE)
-        self.PROCESSED_STORAGE_BASE = os.environ.get(
+        self.STORAGE_BASE = _ENV.get("STORAGE_BASE", STORAGE_BASE)
+        self.PROCESSED_STORAGE_BASE = _ENV.get(
             "PROCESSED_STORAGE_BASE", PROCESSED_STORAGE_BASE
         )
+        self.STORAGE_FSYNC = (
+            _ENV.get("STORAGE_FSYNC", str(STORAGE_FSYNC)).lower() == "true"
+        )
+        self.DROP_PAGE_CACHE = (
+            _ENV.get("DROP_PAGE_CACHE", str(DROP_PAGE_CACHE)).lower() == "true"
+        )
+        self.NORMALIZE_HTML = (
+            _ENV.get("NORMALIZE_HTML", str(NORMALIZE_HTML)).lower() == "true"
+        )
+        self.WRITE_CHUNK_SIZE = WRITE_CHUNK_SIZE
+        self.STORAGE_IO_WORKERS = int(
+            _ENV.get("STORAGE_IO_WORKERS", STORAGE_IO_WORKERS)
+        )
 
         # MongoDB settings
-        self.MONGO_URI = os.environ.get("MONGO_URI", MONGO_URI)
-        self.MONGO_DATABASE = os.environ.get("MONGO_DATABASE", MONGO_DATABASE)
-        self.MONGO_LANDING_COLLECTION = os.environ.get(
+        self.MONGO_URI = _ENV.get("MONGO_URI", MONGO_URI)
+        self.MONGO_DATABASE = _ENV.get("MONGO_DATABASE", MONGO_DATABASE)
+        self.MONGO_LANDING_COLLECTION = _ENV.get(
             "MONGO_LANDING_COLLECTION", MONGO_LANDING_COLLECTION
         )
-        self.MONGO_PROCESSED_COLLECTION = os.environ.get(
+        self.MONGO_PROCESSED_COLLECTION = _ENV.get(
             "MONGO_PROCESSED_COLLECTION", MONGO_PROCESSED_COLLECTION
         )
+        self.MONGO_BATCH_SIZE = int(_ENV.get("MONGO_BATCH_SIZE", MONGO_BATCH_SIZE))
+        self.MONGO_CURSOR_BATCH_SIZE = int(
+            _ENV.get("MONGO_CURSOR_BATCH_SIZE", MONGO_CURSOR_BATCH_SIZE)
+        )
+        self.MONGO_FLUSH_INTERVAL = float(
+            _ENV.get("MONGO_FLUSH_INTERVAL", MONGO_FLUSH_INTERVAL)
+        )
+        self.MONGO_MAX_POOL_SIZE = int(
+            _ENV.get("MONGO_MAX_POOL_SIZE", MONGO_MAX_POOL_SIZE)
+        )
+        self.MONGO_MIN_POOL_SIZE = int(
+            _ENV.get("MONGO_MIN_POOL_SIZE", MONGO_MIN_POOL_SIZE)
+        )
+        self.MONGO_MAX_IDLE_TIME_MS = int(
+            _ENV.get("MONGO_MAX_IDLE_TIME_MS", MONGO_MAX_IDLE_TIME_MS)
+        )
+        self.MONGO_COMPRESSORS = _ENV.get("MONGO_COMPRESSORS", MONGO_COMPRESSORS)
+        self.MONGO_LANDING_WRITE_CONCERN = int(
+            _ENV.get("MONGO_LANDING_WRITE_CONCERN", MONGO_LANDING_WRITE_CONCERN)
+        )
+        self.MONGO_PROCESSED_WRITE_CONCERN = int(
+            _ENV.get("MONGO_PROCESSED_WRITE_CONCERN", MONGO_PROCESSED_WRITE_CONCERN)
+        )
 
         # Spider settings
-        self.MAX_DOCUMENTS = int(os.environ.get("MAX_DOCUMENTS", MAX_DOCUMENTS))
+        self.MAX_DOCUMENTS = int(_ENV.get("MAX_DOCUMENTS", MAX_DOCUMENTS))
         self.ALLOWED_DOMAINS = ALLOWED_DOMAINS
         self.START_URL = START_URL
         self.USER_AGENT = USER_AGENT
 
         # Concurrency settings
         self.CONCURRENT_REQUESTS = int(
-            os.environ.get("CONCURRENT_REQUESTS", CONCURRENT_REQUESTS)
+            _ENV.get("CONCURRENT_REQUESTS", CONCURRENT_REQUESTS)
         )
         self.CONCURRENT_REQUESTS_PER_DOMAIN = int(
-            os.environ.get(
-                "CONCURRENT_REQUESTS_PER_DOMAIN", CONCURRENT_REQUESTS_PER_DOMAIN
-            )
+            _ENV.get("CONCURRENT_REQUESTS_PER_DOMAIN", CONCURRENT_REQUESTS_PER_DOMAIN)
+        )
+        self.DOWNLOAD_DELAY = float(_ENV.get("DOWNLOAD_DELAY", DOWNLOAD_DELAY))
+        self.DOWNLOAD_TIMEOUT = int(_ENV.get("DOWNLOAD_TIMEOUT", DOWNLOAD_TIMEOUT))
+        self.HTTPCACHE_ENABLED = (
+            _ENV.get("HTTPCACHE_ENABLED", str(HTTPCACHE_ENABLED)).lower() == "true"
+        )
+        self.HTTPCACHE_DIR = _ENV.get("HTTPCACHE_DIR", HTTPCACHE_DIR)
+        self.HTTPCACHE_EXPIRATION_SECS = int(
+            _ENV.get("HTTPCACHE_EXPIRATION_SECS", HTTPCACHE_EXPIRATION_SECS)
         )
-        self.DOWNLOAD_DELAY = float(os.environ.get("DOWNLOAD_DELAY", DOWNLOAD_DELAY))
 
         # File processing settings
         self.SUPPORTED_FILE_TYPES = SUPPORTED_FILE_TYPES
@@ -75,8 +110,27 @@ class Settings:
         self.DATE_FORMAT_PARTITION = DATE_FORMAT_PARTITION
         self.PROCESSING_VERSION = PROCESSING_VERSION
 
-    def get_scrapy_settings(self) -> Dict[str, Any]:
-        """Get Scrapy-specific settings dictionary."""
+        # Derived configuration views
+        self._scrapy_settings = MappingProxyType(self._build_scrapy_settings())
+        self._mongo_config = MappingProxyType(self._build_mongo_config())
+        self._storage_config = MappingProxyType(self._build_storage_config())
+
+    @classmethod
+    def refresh(cls) -> "Settings":
+        """
+        Re-read the process environment and reload the shared instance and
+        the logging configuration.
+        """
+        from .logging_config import _logging_config
+
+        global _ENV
+        _ENV = dict(os.environ)
+        settings._load_settings()
+        _logging_config.reload(_ENV)
+        return settings
+
+    def _build_scrapy_settings(self) -> Dict[str, Any]:
+        """Build Scrapy-specific settings dictionary."""
         return {
             "BOT_NAME": self.BOT_NAME,
             "SPIDER_MODULES": self.SPIDER_MODULES,
@@ -86,6 +140,24 @@ class Settings:
             "CONCURRENT_REQUESTS": self.CONCURRENT_REQUESTS,
             "CONCURRENT_REQUESTS_PER_DOMAIN": self.CONCURRENT_REQUESTS_PER_DOMAIN,
             "DOWNLOAD_DELAY": self.DOWNLOAD_DELAY,
+            # The HTTP/1.1 handler keeps connections to the site alive between
+            # requests; a stalled one is given up on after DOWNLOAD_TIMEOUT
+            # instead of holding a download slot for Scrapy's 180s default
+            "DOWNLOAD_TIMEOUT": self.DOWNLOAD_TIMEOUT,
+            "AJAXCRAWL_ENABLED": False,
+            # Every request goes to the same host; resolve it once and fail
+            # fast if DNS is unreachable
+            "DNSCACHE_ENABLED": True,
+            "DNS_TIMEOUT": 10,
+            # Listing pages only; documents are fetched by the storage service,
+            # which revalidates them with ETag/Last-Modified on its own
+            "HTTPCACHE_ENABLED": self.HTTPCACHE_ENABLED,
+            "HTTPCACHE_DIR": self.HTTPCACHE_DIR,
+            "HTTPCACHE_EXPIRATION_SECS": self.HTTPCACHE_EXPIRATION_SECS,
+            "HTTPCACHE_POLICY": "scrapy.extensions.httpcache.RFC2616Policy",
+            "HTTPCACHE_GZIP": True,
+            # Worker threads available to pipelines that defer downloads
+            "REACTOR_THREADPOOL_MAXSIZE": 16,
             "COOKIES_ENABLED": False,
             "TELNETCONSOLE_ENABLED": False,
             "DOWNLOADER_MIDDLEWARES": {
@@ -102,8 +174,8 @@ class Settings:
             "FEED_EXPORT_ENCODING": "utf-8",
         }
 
-    def get_mongo_config(self) -> Dict[str, str]:
-        """Get MongoDB configuration."""
+    def _build_mongo_config(self) -> Dict[str, str]:
+        """Build MongoDB configuration."""
         return {
             "uri": self.MONGO_URI,
             "database": self.MONGO_DATABASE,
@@ -111,13 +183,33 @@ class Settings:
             "processed_collection": self.MONGO_PROCESSED_COLLECTION,
         }
 
-    def get_storage_config(self) -> Dict[str, str]:
-        """Get storage configuration."""
+    def _build_storage_config(self) -> Dict[str, Any]:
+        """Build storage configuration."""
         return {
             "storage_base": self.STORAGE_BASE,
             "processed_storage_base": self.PROCESSED_STORAGE_BASE,
+            "fsync": self.STORAGE_FSYNC,
+            "drop_page_cache": self.DROP_PAGE_CACHE,
+            "normalize_html": self.NORMALIZE_HTML,
+            "url_cache_path": os.path.join(self.STORAGE_BASE, URL_CACHE_FILENAME),
+            "io_workers": self.STORAGE_IO_WORKERS,
         }
 
+    # The views below are built once per load and shared between callers,
+    # so they are returned read-only.
+
+    def get_scrapy_settings(self) -> Mapping[str, Any]:
+        """Get Scrapy-specific settings dictionary."""
+        return self._scrapy_settings
+
+    def get_mongo_config(self) -> Mapping[str, str]:
+        """Get MongoDB configuration."""
+        return self._mongo_config
+
+    def get_storage_config(self) -> Mapping[str, Any]:
+        """Get storage configuration."""
+        return self._storage_config
+
 
 # Global settings instance
 settings = Settings()
@@ -2,13 +2,26 @@
 Document model for workplace relations data.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO, Union
 import hashlib
+import os
 
+_HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
 
-@dataclass
+
+def _file_sha256(fileobj: BinaryIO) -> str:
+    """Stream a binary file object through SHA256."""
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        return hashlib.file_digest(fileobj, "sha256").hexdigest()
+    hasher = hashlib.sha256()
+    for chunk in iter(lambda: fileobj.read(_HASH_CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+@dataclass(slots=True)
 class Document:
     """
     Document model representing a workplace relations document.
@@ -17,6 +30,7 @@ class Document:
         identifier: Unique identifier for the document
         description: Document description
         published_date: Publication date
+        published_dt: Publication date as a datetime, for indexed range queries
         link_to_doc: URL to the original document
         partition_date: Date used for partitioning
         body: Decision-making body
@@ -31,6 +45,7 @@ class Document:
     identifier: str
     description: Optional[str] = None
     published_date: Optional[str] = None
+    published_dt: Optional[datetime] = None
     link_to_doc: Optional[str] = None
     partition_date: Optional[str] = None
     body: Optional[str] = None
@@ -41,8 +56,8 @@ class Document:
     processed_at: Optional[str] = None
     processing_version: Optional[str] = None
 
-    def __post_init__(self):
-        """Post-initialization processing."""
+    def ensure_processed_at(self) -> None:
+        """Stamp the processing timestamp if it has not been set."""
         if self.processed_at is None:
             self.processed_at = datetime.utcnow().isoformat()
 
@@ -52,6 +67,7 @@ class Document:
             "identifier": self.identifier,
             "description": self.description,
             "published_date": self.published_date,
+            "published_dt": self.published_dt,
             "link_to_doc": self.link_to_doc,
             "partition_date": self.partition_date,
             "body": self.body,
@@ -68,9 +84,29 @@ class Document:
         """Create document from dictionary."""
         return cls(**data)
 
-    def calculate_file_hash(self, content: bytes) -> str:
-        """Calculate SHA256 hash of file content."""
-        return hashlib.sha256(content).hexdigest()
+    @classmethod
+    def _from_raw(cls, data: Dict[str, Any]) -> "Document":
+        """
+        Create document from a stored record, positionally.
+
+        Used by the repository read loops; missing fields default to None and
+        keys that are not model fields are ignored.
+        """
+        return cls(*map(data.get, _FIELD_NAMES))
+
+    def calculate_file_hash(self, content: Union[bytes, str, BinaryIO]) -> str:
+        """
+        Calculate SHA256 hash of file content.
+
+        Accepts raw bytes, a path to a file, or a binary file object. Paths and
+        file objects are streamed rather than read into memory.
+        """
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return hashlib.sha256(content).hexdigest()
+        if isinstance(content, (str, os.PathLike)):
+            with open(content, "rb") as f:
+                return _file_sha256(f)
+        return _file_sha256(content)
 
     def is_processed(self) -> bool:
         """Check if document has been processed."""
@@ -87,3 +123,7 @@ class Document:
             and self.body is not None
             and self.partition_date is not None
         )
+
+
+# Constructor argument order, for Document._from_raw
+_FIELD_NAMES = tuple(f.name for f in fields(Document))
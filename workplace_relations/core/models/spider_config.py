@@ -7,7 +7,7 @@ from datetime import date
 from typing import Optional, List, Set
 
 
-@dataclass
+@dataclass(slots=True)
 class SpiderConfig:
     """
     Configuration model for spider execution.
@@ -3,9 +3,13 @@ Document service for handling document processing business logic.
 """
 
 import os
-from datetime import datetime
-from typing import List, Optional, Dict, Any
-from bs4 import BeautifulSoup
+import re
+import threading
+from collections import Counter
+from datetime import date, datetime
+from typing import BinaryIO, Callable, List, Optional, Dict, Any, Tuple
+import lxml.etree
+import lxml.html
 
 from ..models import Document
 from .storage_service import StorageService
@@ -14,6 +18,14 @@ from ..utils import DateUtils
 
 logger = get_logger(__name__)
 
+# Anything other than word characters, space, dot, underscore or hyphen
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w .\-]+")
+
+# Main content container of a decision page (any div with class col-sm-9)
+_CONTENT_DIV_XPATH = lxml.etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' col-sm-9 ')]"
+)
+
 
 class DocumentService:
     """
@@ -24,6 +36,15 @@ class DocumentService:
     def __init__(self, storage_service: Optional[StorageService] = None):
         self.storage_service = storage_service or StorageService()
         self.storage_config = settings.get_storage_config()
+        self._processed_base = self.storage_config["processed_storage_base"]
+        # posix_fadvise is only available on POSIX platforms
+        self._drop_page_cache = self.storage_config["drop_page_cache"] and hasattr(
+            os, "posix_fadvise"
+        )
+        # Directories already created by this service (in-process hint only)
+        self._known_dirs: set[str] = set()
+        # Processed storage directory per (body, partition_date)
+        self._partition_dir_cache: Dict[Tuple[str, str], str] = {}
 
     def handle_duplicates(self, documents: List[Document]) -> Dict[str, Any]:
         """
@@ -45,34 +66,39 @@ class DocumentService:
                 "action_taken": "No documents provided",
             }
 
-        # Group documents by identifier
-        grouped = {}
-        for doc in documents:
-            grouped.setdefault(doc.identifier, []).append(doc)
+        # Count identifiers first so only duplicate groups get a list
+        counts = Counter(doc.identifier for doc in documents)
+        duplicate_ids = {key for key, count in counts.items() if count > 1}
 
-        # Filter only duplicates
-        duplicates = {k: v for k, v in grouped.items() if len(v) > 1}
-
-        if not duplicates:
+        if not duplicate_ids:
             return {
                 "total_duplicates": 0,
                 "duplicates": [],
                 "action_taken": "No duplicates found",
             }
 
+        # Group duplicate documents by identifier
+        duplicates: Dict[str, List[Document]] = {}
+        for doc in documents:
+            if doc.identifier in duplicate_ids:
+                duplicates.setdefault(doc.identifier, []).append(doc)
+
+        # Parse each published_date once for all duplicate groups
+        date_cache = {
+            id(doc): DateUtils.parse_date(doc.published_date) or date.min
+            for docs in duplicates.values()
+            for doc in docs
+        }
+
         # For each duplicate group, keep the most recent one based on published_date
         actions = []
         for identifier, docs in duplicates.items():
-            # Sort by published_date (newest first)
-            sorted_docs = sorted(
-                docs,
-                key=lambda x: DateUtils.parse_date(x.published_date) or datetime.min,
-                reverse=True,
-            )
+            keeper = max(docs, key=lambda x: date_cache[id(x)])
 
-            # Keep the first one (most recent), mark others as duplicates
-            keeper = sorted_docs[0]
-            for doc in sorted_docs[1:]:
+            # Mark all others as duplicates
+            for doc in docs:
+                if doc is keeper:
+                    continue
                 self.storage_service.delete_document(doc.file_path)
                 actions.append(
                     f"Deleted duplicate {doc.identifier} (keeping {keeper.identifier})"
@@ -102,6 +128,11 @@ class DocumentService:
                 logger.warning(f"Document file not found: {document.file_path}")
                 return None
 
+            # Binary documents are stored unchanged, so copy and hash them as
+            # streams instead of loading them into memory
+            if (document.file_type or "").lower() != "html":
+                return self._process_binary_document(document)
+
             # Read original content
             original_content = self.storage_service.retrieve_document(
                 document.file_path
@@ -117,7 +148,9 @@ class DocumentService:
                 return None
 
             # Create processed document
-            processed_doc = self._create_processed_document(document, processed_content)
+            processed_doc = self._create_processed_document(
+                document, document.calculate_file_hash(processed_content)
+            )
 
             # Store processed document
             if not self._store_processed_document(processed_doc, processed_content):
@@ -129,6 +162,19 @@ class DocumentService:
             logger.error(f"Failed to process document {document.identifier}: {e}")
             return None
 
+    def _process_binary_document(self, document: Document) -> Optional[Document]:
+        """Copy a PDF/DOC document into processed storage unchanged."""
+        processed_doc = self._create_processed_document(
+            document, document.calculate_file_hash(document.file_path)
+        )
+        if not self._write_file(
+            processed_doc.file_path,
+            lambda f: self.storage_service.copy_document(document.file_path, f),
+        ):
+            return None
+        logger.debug(f"Stored processed document: {processed_doc.file_path}")
+        return processed_doc
+
     def _process_content(
         self, content: bytes, file_type: Optional[str]
     ) -> Optional[bytes]:
@@ -149,34 +195,40 @@ class DocumentService:
     def _process_html_content(self, content: bytes) -> bytes:
         """Process HTML content by extracting relevant sections."""
         try:
-            soup = BeautifulSoup(content.decode("utf-8"), "html.parser")
+            # Pages are normally UTF-8. Anything else is decoded as cp1252
+            # rather than left to lxml, which silently drops the text of
+            # pages whose charset label libxml2 doesn't recognise
+            try:
+                markup = content.decode("utf-8")
+            except UnicodeDecodeError:
+                markup = content.decode("cp1252", errors="replace")
+            root = lxml.html.document_fromstring(markup)
 
             # Extract relevant content (adjust selectors as needed)
-            content_div = soup.find("div", {"class": "col-sm-9"})
-            if not content_div:
-                content_div = soup.find("body") or soup
+            matches = _CONTENT_DIV_XPATH(root)
+            content_div = matches[0] if matches else root.body
+
+            # Keep the original page rather than store an empty extract
+            if content_div is None or not content_div.text_content().strip():
+                logger.warning("No text found in HTML content; keeping original")
+                return content
 
-            return str(content_div).encode("utf-8")
+            return lxml.html.tostring(content_div, encoding="utf-8", with_tail=False)
         except Exception as e:
             logger.error(f"Failed to process HTML content: {e}")
             return content
 
     def _create_processed_document(
-        self, original_doc: Document, processed_content: bytes
+        self, original_doc: Document, new_file_hash: str
     ) -> Document:
         """Create a processed document from the original."""
-        # Calculate new hash
-        new_file_hash = original_doc.calculate_file_hash(processed_content)
-
         # Create new filename
         safe_identifier = self._sanitize_filename(original_doc.identifier)[:100]
         new_filename = f"{safe_identifier}.{original_doc.file_type}"
 
         # Create new storage path
-        new_storage_path = os.path.join(
-            self.storage_config["processed_storage_base"],
-            self._sanitize_filename(original_doc.body or "unknown"),
-            original_doc.partition_date or "unknown",
+        new_storage_path = self._get_partition_dir(
+            original_doc.body or "unknown", original_doc.partition_date or "unknown"
         )
         new_file_path = os.path.join(new_storage_path, new_filename)
 
@@ -185,6 +237,7 @@ class DocumentService:
             identifier=original_doc.identifier,
             description=original_doc.description,
             published_date=original_doc.published_date,
+            published_dt=original_doc.published_dt,
             link_to_doc=original_doc.link_to_doc,
             partition_date=original_doc.partition_date,
             body=original_doc.body,
@@ -192,18 +245,74 @@ class DocumentService:
             file_hash=new_file_hash,
             file_type=original_doc.file_type,
             original_file_path=original_doc.file_path,
-            processed_at=datetime.utcnow().isoformat(),
             processing_version=settings.PROCESSING_VERSION,
         )
+        processed_doc.ensure_processed_at()
 
         return processed_doc
 
+    def _get_partition_dir(self, body: str, partition_date: str) -> str:
+        """Get the processed storage directory for a body and partition."""
+        key = (body, partition_date)
+        directory = self._partition_dir_cache.get(key)
+        if directory is None:
+            directory = os.path.join(
+                self._processed_base, self._sanitize_filename(body), partition_date
+            )
+            self._partition_dir_cache[key] = directory
+        return directory
+
+    def _ensure_directory(self, directory: str) -> None:
+        """Create directory unless this service already created it."""
+        if directory not in self._known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._known_dirs.add(directory)
+
+    def _open_for_write(self, file_path: str) -> BinaryIO:
+        """Open a processed file for writing, creating its directory once."""
+        directory = os.path.dirname(file_path)
+        self._ensure_directory(directory)
+        try:
+            return open(file_path, "wb")
+        except FileNotFoundError:
+            # The directory was removed after it was cached; recreate it
+            self._known_dirs.discard(directory)
+            self._ensure_directory(directory)
+            return open(file_path, "wb")
+
+    def _write_file(self, file_path: str, write: Callable[[BinaryIO], bool]) -> bool:
+        """
+        Write a processed file through a temporary sibling renamed into place.
+
+        write is called with the open temporary file and returns False on
+        failure. A failed or interrupted write leaves nothing at file_path.
+        """
+        tmp_path = f"{file_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        replaced = False
+        try:
+            with self._open_for_write(tmp_path) as f:
+                if not write(f):
+                    return False
+                self._release_written_pages(f)
+            os.replace(tmp_path, file_path)
+            replaced = True
+            return True
+        finally:
+            if not replaced:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
     def _store_processed_document(self, document: Document, content: bytes) -> bool:
         """Store processed document content."""
+
+        def write(f: BinaryIO) -> bool:
+            f.write(content)
+            return True
+
         try:
-            os.makedirs(os.path.dirname(document.file_path), exist_ok=True)
-            with open(document.file_path, "wb") as f:
-                f.write(content)
+            self._write_file(document.file_path, write)
             logger.debug(f"Stored processed document: {document.file_path}")
             return True
         except Exception as e:
@@ -212,10 +321,23 @@ class DocumentService:
             )
             return False
 
+    def _release_written_pages(self, f) -> None:
+        """
+        Drop a just-written file's pages from the OS page cache.
+
+        Processed files are not read back during a run, so keeping them cached
+        only evicts pages that are still useful. The data is synced first,
+        because the kernel cannot drop dirty pages.
+        """
+        if not self._drop_page_cache:
+            return
+        f.flush()
+        os.fdatasync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
     def _sanitize_filename(self, name: str) -> str:
         """Convert string to safe filename."""
-        keepchars = (" ", ".", "_", "-")
-        return "".join(c for c in name if c.isalnum() or c in keepchars).rstrip()
+        return _UNSAFE_FILENAME_CHARS.sub("", name).rstrip()
 
     def validate_document(self, document: Document) -> bool:
         """Validate document data."""
@@ -232,40 +354,55 @@ class DocumentService:
                 "date_range": None,
             }
 
+        strptime = datetime.strptime
+        date_format = settings.DATE_FORMAT_DISPLAY
+
+        def parse(published_date: str) -> Optional[datetime]:
+            try:
+                return strptime(published_date, date_format)
+            except ValueError:
+                return None
+
+        parsed_dates = [
+            parsed
+            for parsed in (
+                parse(doc.published_date) for doc in documents if doc.published_date
+            )
+            if parsed is not None
+        ]
+
         stats = {
             "total_documents": len(documents),
             "processed_documents": sum(1 for doc in documents if doc.is_processed()),
-            "file_types": {},
-            "bodies": {},
-            "date_range": {"earliest": None, "latest": None},
+            "file_types": dict(
+                Counter(doc.file_type or "unknown" for doc in documents)
+            ),
+            "bodies": dict(Counter(doc.body or "unknown" for doc in documents)),
+            "date_range": {
+                "earliest": min(parsed_dates, default=None),
+                "latest": max(parsed_dates, default=None),
+            },
         }
 
-        for doc in documents:
-            # Count file types
-            file_type = doc.file_type or "unknown"
-            stats["file_types"][file_type] = stats["file_types"].get(file_type, 0) + 1
+        return stats
 
-            # Count bodies
-            body = doc.body or "unknown"
-            stats["bodies"][body] = stats["bodies"].get(body, 0) + 1
 
-            # Track date range
-            if doc.published_date:
-                try:
-                    date_obj = datetime.strptime(
-                        doc.published_date, settings.DATE_FORMAT_DISPLAY
-                    )
-                    if (
-                        not stats["date_range"]["earliest"]
-                        or date_obj < stats["date_range"]["earliest"]
-                    ):
-                        stats["date_range"]["earliest"] = date_obj
-                    if (
-                        not stats["date_range"]["latest"]
-                        or date_obj > stats["date_range"]["latest"]
-                    ):
-                        stats["date_range"]["latest"] = date_obj
-                except ValueError:
-                    pass
+# Per-process service used by process_document_in_worker
+_worker_service: Optional[DocumentService] = None
 
-        return stats
+
+def process_document_in_worker(document: Document) -> Optional[Document]:
+    """
+    Process a document in a worker process.
+
+    A top-level function so it can be pickled for a ProcessPoolExecutor; each
+    worker builds its own DocumentService on first use.
+    """
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = DocumentService()
+    try:
+        return _worker_service.process_document(document)
+    except Exception as e:
+        logger.error(f"Failed to process document {document.identifier}: {e}")
+        return None
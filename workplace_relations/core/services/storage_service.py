@@ -3,18 +3,88 @@ Storage service for managing file storage operations.
 Implements the Strategy pattern for different storage backends.
 """
 
+import asyncio
+import atexit
+import hashlib
+import json
 import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Iterable, List, BinaryIO, Tuple
 from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound
 
 from ..models import Document
+from ..utils import FileUtils
 from workplace_relations.config import settings, get_logger
 
 logger = get_logger(__name__)
 
+# Filename suffix used for stored documents (prefix of the empty-content SHA256)
+_EMPTY_SHA256_PREFIX = hashlib.sha256(b"").digest()[:4].hex()
+
+# Anything other than word characters, space, dot, underscore or hyphen
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w .\-]+")
+
+# Connect and read timeouts for document downloads (seconds)
+DOWNLOAD_TIMEOUT = (5, 30)
+
+# Maximum number of directories remembered as already created
+_KNOWN_DIRS_LIMIT = 10_000
+
+# Number of URL cache updates between sidecar saves
+_URL_CACHE_SAVE_INTERVAL = 50
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session shared by all document downloads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=100,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = settings.USER_AGENT
+    return session
+
+
+_SESSION = _create_session()
+# Shared by every StorageService, so it is closed at process exit only
+atexit.register(_SESSION.close)
+
+
+@dataclass(slots=True)
+class _DownloadResult:
+    """
+    Outcome of a (possibly conditional) document download.
+
+    A successful download holds either the content in memory or a handle to
+    content staged by the storage strategy for storage_path.
+    """
+
+    content: Optional[bytes] = None
+    staged: Any = None
+    storage_path: Optional[str] = None
+    file_type: Optional[str] = None
+    file_hash: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
 
 class StorageStrategy(ABC):
     """Abstract base class for storage strategies."""
@@ -24,11 +94,57 @@ class StorageStrategy(ABC):
         """Store file content at the specified path."""
         pass
 
+    async def astore_file(self, content: bytes, file_path: str) -> bool:
+        """Store file content without blocking the event loop."""
+        return await asyncio.to_thread(self.store_file, content, file_path)
+
+    def stage_stream(self, chunks: Iterable[bytes], file_path: str) -> Tuple[Any, str]:
+        """
+        Stage streamed content for file_path, hashing it as chunks arrive.
+
+        Nothing is visible at file_path until commit_staged is called; pass
+        the handle to discard_staged instead to drop the content. Raises if
+        the content can't be read or staged.
+
+        Returns:
+            Staging handle and SHA256 hex digest of the content
+        """
+        hasher = hashlib.sha256()
+        content = bytearray()
+        for chunk in chunks:
+            hasher.update(chunk)
+            content += chunk
+        return bytes(content), hasher.hexdigest()
+
+    def commit_staged(self, staged: Any, file_path: str) -> bool:
+        """Store content staged by stage_stream at file_path."""
+        return self.store_file(staged, file_path)
+
+    def discard_staged(self, staged: Any) -> None:
+        """Drop content staged by stage_stream."""
+
     @abstractmethod
     def retrieve_file(self, file_path: str) -> Optional[bytes]:
         """Retrieve file content from the specified path."""
         pass
 
+    def copy_file(self, file_path: str, writer: BinaryIO) -> bool:
+        """Copy stored file content into an open binary writer."""
+        content = self.retrieve_file(file_path)
+        if content is None:
+            return False
+        writer.write(content)
+        return True
+
+    def link_file(self, source_path: str, file_path: str) -> bool:
+        """
+        Make stored content available at a second path without rewriting it.
+
+        Returns False if the strategy cannot do so; callers then store the
+        content normally.
+        """
+        return False
+
     @abstractmethod
     def file_exists(self, file_path: str) -> bool:
         """Check if file exists at the specified path."""
@@ -43,16 +159,119 @@ class StorageStrategy(ABC):
 class LocalFileStorageStrategy(StorageStrategy):
     """Local filesystem storage strategy."""
 
+    def __init__(self, fsync: bool = False):
+        self.fsync = fsync
+        self.chunk_size = settings.WRITE_CHUNK_SIZE
+        # LRU of directories already created, to skip repeated makedirs calls
+        self._known_dirs: OrderedDict[str, None] = OrderedDict()
+        self._known_dirs_lock = threading.Lock()
+
+    def _ensure_directory(self, directory: str) -> None:
+        """Create directory unless it was created by a recent write."""
+        with self._known_dirs_lock:
+            if directory in self._known_dirs:
+                self._known_dirs.move_to_end(directory)
+                return
+        os.makedirs(directory, exist_ok=True)
+        with self._known_dirs_lock:
+            self._known_dirs[directory] = None
+            if len(self._known_dirs) > _KNOWN_DIRS_LIMIT:
+                self._known_dirs.popitem(last=False)
+
     def store_file(self, content: bytes, file_path: str) -> bool:
-        """Store file content to local filesystem."""
+        """
+        Store file content to local filesystem in fixed-size blocks.
+
+        Content is written to a temporary sibling file and renamed into
+        place, so a crash mid-write never leaves a partial file behind.
+        """
+        tmp_path = f"{file_path}.tmp.{os.getpid()}.{threading.get_ident()}"
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, "wb") as f:
-                f.write(content)
+            directory = os.path.dirname(file_path)
+            self._ensure_directory(directory)
+            chunk_size = self.chunk_size
+            view = memoryview(content)
+            with open(tmp_path, "wb", buffering=chunk_size) as f:
+                for offset in range(0, len(view), chunk_size):
+                    f.write(view[offset : offset + chunk_size])
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
             logger.debug(f"Stored file: {file_path}")
             return True
         except Exception as e:
             logger.error(f"Failed to store file {file_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            # The directory may have been removed underneath us
+            with self._known_dirs_lock:
+                self._known_dirs.pop(os.path.dirname(file_path), None)
+            return False
+
+    def stage_stream(self, chunks: Iterable[bytes], file_path: str) -> Tuple[str, str]:
+        """
+        Write streamed content to a partial sibling file of file_path,
+        hashing each chunk in the same loop, so the body is never held in
+        memory as a whole.
+
+        Returns:
+            Path of the partial file and SHA256 hex digest of the content
+        """
+        part_path = f"{file_path}.part.{os.getpid()}.{threading.get_ident()}"
+        hasher = hashlib.sha256()
+        try:
+            self._ensure_directory(os.path.dirname(file_path))
+            with open(part_path, "wb", buffering=self.chunk_size) as f:
+                for chunk in chunks:
+                    hasher.update(chunk)
+                    f.write(chunk)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except BaseException:
+            self.discard_staged(part_path)
+            with self._known_dirs_lock:
+                self._known_dirs.pop(os.path.dirname(file_path), None)
+            raise
+        return part_path, hasher.hexdigest()
+
+    def commit_staged(self, staged: str, file_path: str) -> bool:
+        """Rename a partial file written by stage_stream into place."""
+        try:
+            os.replace(staged, file_path)
+            logger.debug(f"Stored file: {file_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to store file {file_path}: {e}")
+            self.discard_staged(staged)
+            return False
+
+    def discard_staged(self, staged: str) -> None:
+        """Remove a partial file written by stage_stream."""
+        try:
+            os.remove(staged)
+        except OSError:
+            pass
+
+    def link_file(self, source_path: str, file_path: str) -> bool:
+        """Hard-link an already stored file to a second path."""
+        tmp_path = f"{file_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        try:
+            self._ensure_directory(os.path.dirname(file_path))
+            os.link(source_path, tmp_path)
+            os.replace(tmp_path, file_path)
+            logger.debug(f"Linked file: {file_path} -> {source_path}")
+            return True
+        except OSError as e:
+            # e.g. different filesystems, or links unsupported; store instead
+            logger.debug(f"Could not link {file_path} to {source_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
 
     def retrieve_file(self, file_path: str) -> Optional[bytes]:
@@ -66,6 +285,53 @@ class LocalFileStorageStrategy(StorageStrategy):
             logger.error(f"Failed to retrieve file {file_path}: {e}")
             return None
 
+    def copy_file(self, file_path: str, writer: BinaryIO) -> bool:
+        """
+        Copy file content into writer in the kernel where possible.
+
+        Tries copy_file_range first, then sendfile, and falls back to a
+        buffered copy for writers without a file descriptor.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                try:
+                    out_fd = writer.fileno()
+                except (AttributeError, OSError, ValueError):
+                    out_fd = None
+
+                if out_fd is None or not hasattr(os, "sendfile"):
+                    shutil.copyfileobj(f, writer, self.chunk_size)
+                    return True
+
+                writer.flush()
+                in_fd = f.fileno()
+                size = os.fstat(in_fd).st_size
+                offset = 0
+                if hasattr(os, "copy_file_range"):
+                    # Copies within the filesystem, or reflinks on CoW ones
+                    try:
+                        while offset < size:
+                            copied = os.copy_file_range(
+                                in_fd, out_fd, size - offset, offset
+                            )
+                            if copied == 0:
+                                break
+                            offset += copied
+                    except OSError:
+                        # Unsupported for this pair of files; use sendfile
+                        pass
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                # Resync the writer with the descriptor advanced by the copy
+                writer.seek(os.lseek(out_fd, 0, os.SEEK_CUR))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to copy file {file_path}: {e}")
+            return False
+
     def file_exists(self, file_path: str) -> bool:
         """Check if file exists in local filesystem."""
         return os.path.exists(file_path)
@@ -90,8 +356,35 @@ class StorageService:
     """
 
     def __init__(self, strategy: Optional[StorageStrategy] = None):
-        self.strategy = strategy or LocalFileStorageStrategy()
         self.storage_config = settings.get_storage_config()
+        self.strategy = strategy or LocalFileStorageStrategy(
+            fsync=self.storage_config["fsync"]
+        )
+        self._url_cache_path = self.storage_config["url_cache_path"]
+        self._url_cache: Dict[str, Dict[str, Any]] = self._load_url_cache()
+        self._url_cache_lock = threading.Lock()
+        self._url_cache_pending = 0
+        # Stored path per content hash, so identical documents published
+        # under several identifiers are written to disk once
+        self._content_paths: Dict[str, str] = {
+            record["file_hash"]: record["file_path"]
+            for record in self._url_cache.values()
+            if record.get("file_hash")
+        }
+        # Created on first batch download, so instances that only read or
+        # store files (and are never closed) don't hold idle threads
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._io_pool_lock = threading.Lock()
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Return the batch download pool, creating it on first use."""
+        with self._io_pool_lock:
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(
+                    max_workers=self.storage_config["io_workers"],
+                    thread_name_prefix="storage-io",
+                )
+            return self._io_pool
 
     def download_and_store_document(
         self, document: Document
@@ -109,87 +402,282 @@ class StorageService:
             logger.warning(f"No link provided for document {document.identifier}")
             return None
 
+        url = document.link_to_doc
+        download: Optional[_DownloadResult] = None
         try:
-            # Download file content
-            content, file_type = self._download_file_content(document.link_to_doc)
-            if content is None:
+            # Revalidate previously downloaded URLs instead of refetching them
+            cached = self._url_cache.get(url)
+            if cached and not self.strategy.file_exists(cached["file_path"]):
+                cached = None
+
+            # Download, hash and stage file content
+            download = self._download_file_content(url, document, cached)
+            if download.not_modified:
+                logger.debug(f"Document unchanged since last download: {url}")
+                return self._file_info(cached)
+            if download.file_hash is None:
                 return None
+            storage_path = download.storage_path
 
-            # Calculate file hash
-            file_hash = document.calculate_file_hash(content)
-
-            # Determine file extension
-            file_ext = self._get_file_extension(document.link_to_doc, file_type)
-
-            # Create storage path
-            storage_path = self._create_storage_path(document, file_ext)
-
-            # Store file
-            if not self.strategy.store_file(content, storage_path):
+            # Store file unless identical content is already in place
+            unchanged = (
+                cached is not None
+                and cached["file_path"] == storage_path
+                and cached["file_hash"] == download.file_hash
+            )
+            if unchanged or self._link_known_content(download.file_hash, storage_path):
+                self._discard_download(download)
+            elif download.staged is not None:
+                staged, download.staged = download.staged, None
+                if not self.strategy.commit_staged(staged, storage_path):
+                    return None
+            elif not self.strategy.store_file(download.content, storage_path):
                 return None
 
-            return {
+            record = {
                 "file_path": storage_path,
-                "file_hash": file_hash,
-                "file_type": file_ext,
+                "file_hash": download.file_hash,
+                "file_type": download.file_type,
+                "etag": download.etag,
+                "last_modified": download.last_modified,
             }
+            self._remember_url(url, record)
+            return self._file_info(record)
 
         except Exception as e:
             logger.error(
                 f"Failed to download and store document {document.identifier}: {e}"
             )
+            if download is not None:
+                self._discard_download(download)
             return None
 
-    def _download_file_content(self, url: str) -> tuple[Optional[bytes], Optional[str]]:
-        """Download file content from URL."""
+    def _discard_download(self, download: _DownloadResult) -> None:
+        """Drop staged content that will not be committed."""
+        if download.staged is not None:
+            staged, download.staged = download.staged, None
+            self.strategy.discard_staged(staged)
+
+    def download_and_store_batch(
+        self, documents: List[Document], max_in_flight: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Download and store several documents on the storage I/O pool.
+
+        Downloads, hashing and file writes for different documents overlap
+        across the pool's threads, and at most max_in_flight documents are
+        submitted at once so downloaded content does not pile up in memory.
+
+        Args:
+            documents: Documents to download
+            max_in_flight: Maximum number of submitted documents (defaults to
+                twice the pool size)
+
+        Returns:
+            File information (or None if failed) for each document, in order
+        """
+        window = max_in_flight or 2 * self.storage_config["io_workers"]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(documents)
+        pending = {}
+        io_pool = self._get_io_pool()
+
+        for index, document in enumerate(documents):
+            if len(pending) >= window:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+            future = io_pool.submit(self.download_and_store_document, document)
+            pending[future] = index
+
+        for future in list(pending):
+            results[pending.pop(future)] = future.result()
+        return results
+
+    async def download_and_store_documents(
+        self, documents: List[Document], max_concurrency: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Download and store several documents concurrently.
+
+        Each download runs on the storage I/O pool over the shared HTTP
+        session, so network waits and file writes overlap without blocking
+        the event loop.
+
+        Args:
+            documents: Documents to download
+            max_concurrency: Maximum number of downloads in flight (defaults
+                to the pool size)
+
+        Returns:
+            File information (or None if failed) for each document, in order
+        """
+        semaphore = asyncio.Semaphore(
+            max_concurrency or self.storage_config["io_workers"]
+        )
+        loop = asyncio.get_running_loop()
+        io_pool = self._get_io_pool()
+
+        async def download_one(document: Document) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    io_pool, self.download_and_store_document, document
+                )
+
+        return await asyncio.gather(*(download_one(doc) for doc in documents))
+
+    def _file_info(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the file information returned to callers from a record."""
+        return {
+            "file_path": record["file_path"],
+            "file_hash": record["file_hash"],
+            "file_type": record["file_type"],
+        }
+
+    def _load_url_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the URL cache sidecar file, if present."""
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            with open(self._url_cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable URL cache {self._url_cache_path}: {e}")
+            return {}
+
+    def _link_known_content(self, file_hash: str, storage_path: str) -> bool:
+        """Link storage_path to an already stored file with the same content."""
+        with self._url_cache_lock:
+            source_path = self._content_paths.get(file_hash)
+        if not source_path or source_path == storage_path:
+            return False
+        if not self.strategy.file_exists(source_path):
+            return False
+        return self.strategy.link_file(source_path, storage_path)
+
+    def _remember_url(self, url: str, record: Dict[str, Any]) -> None:
+        """Record a download in the URL cache, saving it periodically."""
+        with self._url_cache_lock:
+            previous = self._url_cache.get(url)
+            if previous and previous["file_hash"] != record["file_hash"]:
+                # The old content was replaced at its path; stop linking to it
+                if self._content_paths.get(previous["file_hash"]) == previous.get(
+                    "file_path"
+                ):
+                    del self._content_paths[previous["file_hash"]]
+            self._url_cache[url] = record
+            self._content_paths.setdefault(record["file_hash"], record["file_path"])
+            self._url_cache_pending += 1
+            if self._url_cache_pending >= _URL_CACHE_SAVE_INTERVAL:
+                self._save_url_cache_locked()
+
+    def save_url_cache(self) -> None:
+        """Persist the URL cache sidecar file."""
+        with self._url_cache_lock:
+            self._save_url_cache_locked()
+
+    def _save_url_cache_locked(self) -> None:
+        """Atomically write the URL cache; caller must hold the lock."""
+        tmp_path = f"{self._url_cache_path}.tmp.{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(self._url_cache_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._url_cache, f)
+            os.replace(tmp_path, self._url_cache_path)
+            self._url_cache_pending = 0
+        except Exception as e:
+            logger.error(f"Failed to save URL cache {self._url_cache_path}: {e}")
+
+    def _download_file_content(
+        self,
+        url: str,
+        document: Document,
+        cached: Optional[Dict[str, Any]] = None,
+    ) -> _DownloadResult:
+        """
+        Download file content from URL.
 
-            # Determine content type
-            content_type = response.headers.get("content-type", "").lower()
+        When a cached record is given, the request is made conditional on its
+        ETag/Last-Modified validators and a 304 response is reported as
+        not modified without transferring the body.
 
-            if "pdf" in content_type:
-                return response.content, "pdf"
-            elif "msword" in content_type or "docx" in content_type:
-                return response.content, "docx" if "docx" in content_type else "doc"
-            else:
-                # Assume HTML content
-                soup = BeautifulSoup(response.text, "html.parser")
-                return str(soup).encode("utf-8"), "html"
+        Once the response headers fix the file type, and with it the storage
+        path, the body is streamed to the storage strategy's staging area,
+        hashing each chunk as it is written, so it is never held in memory
+        as a whole. HTML is stored as received unless the normalize_html
+        storage option is enabled; normalizing needs the whole page in
+        memory.
+
+        Returns:
+            Download result with staged content (or content), storage path,
+            file extension and SHA256 hex digest
+        """
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            with _SESSION.get(
+                url, headers=headers, timeout=DOWNLOAD_TIMEOUT, stream=True
+            ) as response:
+                if response.status_code == 304 and cached:
+                    return _DownloadResult(not_modified=True)
+                response.raise_for_status()
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+
+                # Determine file type from the content type, assuming HTML
+                file_type = (
+                    FileUtils.get_content_type_extension(
+                        response.headers.get("content-type")
+                    )
+                    or "html"
+                )
+                file_ext = FileUtils.get_file_extension(url, file_type)
+                storage_path = self._create_storage_path(document, file_ext)
+                if file_type == "html" and self.storage_config["normalize_html"]:
+                    content = self._normalize_html(response.content)
+                    file_hash = hashlib.sha256(content).hexdigest()
+                    return _DownloadResult(
+                        content=content,
+                        storage_path=storage_path,
+                        file_type=file_ext,
+                        file_hash=file_hash,
+                        etag=etag,
+                        last_modified=last_modified,
+                    )
+
+                staged, file_hash = self.strategy.stage_stream(
+                    response.iter_content(settings.WRITE_CHUNK_SIZE), storage_path
+                )
+                return _DownloadResult(
+                    staged=staged,
+                    storage_path=storage_path,
+                    file_type=file_ext,
+                    file_hash=file_hash,
+                    etag=etag,
+                    last_modified=last_modified,
+                )
 
         except Exception as e:
             logger.error(f"Failed to download file from {url}: {e}")
-            return None, None
-
-    def _get_file_extension(self, url: str, content_type: Optional[str]) -> str:
-        """Determine file extension from URL and content type."""
-        parsed_url = urlparse(url)
-        path = parsed_url.path.lower()
-
-        if path.endswith(".pdf"):
-            return "pdf"
-        elif path.endswith(".docx"):
-            return "docx"
-        elif path.endswith(".doc"):
-            return "doc"
-        elif content_type:
-            if "pdf" in content_type:
-                return "pdf"
-            elif "docx" in content_type:
-                return "docx"
-            elif "msword" in content_type:
-                return "doc"
-
-        return "html"
+            return _DownloadResult()
+
+    def _normalize_html(self, content: bytes) -> bytes:
+        """Re-serialize HTML through BeautifulSoup, writing bytes directly."""
+        try:
+            soup = BeautifulSoup(content, "lxml")
+        except FeatureNotFound:
+            soup = BeautifulSoup(content, "html.parser")
+        return soup.encode("utf-8", formatter="minimal")
 
     def _create_storage_path(self, document: Document, file_ext: str) -> str:
         """Create storage path for the document."""
         # Sanitize filename
         safe_identifier = self._sanitize_filename(document.identifier)[:100]
-        filename = (
-            f"{safe_identifier}_{document.calculate_file_hash(b'')[:8]}.{file_ext}"
-        )
+        filename = f"{safe_identifier}_{_EMPTY_SHA256_PREFIX}.{file_ext}"
 
         # Create organized storage path
         storage_path = os.path.join(
@@ -202,13 +690,16 @@ class StorageService:
 
     def _sanitize_filename(self, name: str) -> str:
         """Convert string to safe filename."""
-        keepchars = (" ", ".", "_", "-")
-        return "".join(c for c in name if c.isalnum() or c in keepchars).rstrip()
+        return _UNSAFE_FILENAME_CHARS.sub("", name).rstrip()
 
     def retrieve_document(self, file_path: str) -> Optional[bytes]:
         """Retrieve document content from storage."""
         return self.strategy.retrieve_file(file_path)
 
+    def copy_document(self, file_path: str, writer: BinaryIO) -> bool:
+        """Copy document content from storage into an open binary writer."""
+        return self.strategy.copy_file(file_path, writer)
+
     def document_exists(self, file_path: str) -> bool:
         """Check if document exists in storage."""
         return self.strategy.file_exists(file_path)
@@ -216,3 +707,15 @@ class StorageService:
     def delete_document(self, file_path: str) -> bool:
         """Delete document from storage."""
         return self.strategy.delete_file(file_path)
+
+    def close(self) -> None:
+        """
+        Save the URL cache and stop the I/O pool.
+
+        The HTTP session is shared by all instances and stays open.
+        """
+        with self._io_pool_lock:
+            io_pool, self._io_pool = self._io_pool, None
+        if io_pool is not None:
+            io_pool.shutdown(wait=True)
+        self.save_url_cache()
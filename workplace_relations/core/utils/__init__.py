@@ -5,5 +5,6 @@ Core utilities for the workplace relations scraper.
 from .date_utils import DateUtils
 from .file_utils import FileUtils
 from .monitoring import ScraperMonitor
+from .validation_utils import ValidationUtils
 
 __all__ = ["DateUtils", "FileUtils", "ValidationUtils", "ScraperMonitor"]
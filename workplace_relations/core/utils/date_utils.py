@@ -2,10 +2,51 @@
 Date utility functions for the workplace relations scraper.
 """
 
+import calendar
+import re
 from datetime import datetime, date
 from typing import List, Tuple, Optional
 from workplace_relations.config import settings
 
+# Regex fast paths for the formats used by the scraper, avoiding strptime.
+# Each entry maps a format to its pattern and the (year, month, day) group order.
+_FAST_DATE_FORMATS = {
+    "%Y-%m-%d": (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})"), (0, 1, 2)),
+    "%d/%m/%Y": (re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})"), (2, 1, 0)),
+    "%m-%d-%Y": (re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})"), (2, 0, 1)),
+}
+
+
+def _parse_with_format(date_str: str, format_str: str) -> Optional[date]:
+    """Parse date string with a single format, returning None on mismatch."""
+    if format_str == "%Y-%m-%d" and len(date_str) == 10:
+        # date.fromisoformat is implemented in C; the regex below still
+        # handles dates without zero padding. The length check keeps the
+        # extended ISO forms accepted by 3.11 (e.g. "20240105") out.
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+
+    fast_path = _FAST_DATE_FORMATS.get(format_str)
+    if fast_path is None:
+        try:
+            return datetime.strptime(date_str, format_str).date()
+        except ValueError:
+            return None
+
+    pattern, (year_index, month_index, day_index) = fast_path
+    match = pattern.fullmatch(date_str)
+    if match is None:
+        return None
+    groups = match.groups()
+    try:
+        return date(
+            int(groups[year_index]), int(groups[month_index]), int(groups[day_index])
+        )
+    except ValueError:
+        return None
+
 
 class DateUtils:
     """Utility class for date operations."""
@@ -27,16 +68,14 @@ class DateUtils:
 
         format_to_use = format_str or settings.DATE_FORMAT_INPUT
 
-        try:
-            return datetime.strptime(date_str, format_to_use).date()
-        except ValueError:
-            # Try alternative formats
-            for alt_format in [settings.DATE_FORMAT_DISPLAY, "%Y-%m-%d", "%m-%d-%Y"]:
-                try:
-                    return datetime.strptime(date_str, alt_format).date()
-                except ValueError:
-                    continue
-            return None
+        # Try the requested format, then alternative formats, each only once
+        for candidate in dict.fromkeys(
+            (format_to_use, settings.DATE_FORMAT_DISPLAY, "%Y-%m-%d", "%m-%d-%Y")
+        ):
+            parsed = _parse_with_format(date_str, candidate)
+            if parsed is not None:
+                return parsed
+        return None
 
     @staticmethod
     def format_date(date_obj: date, format_str: Optional[str] = None) -> str:
@@ -65,30 +104,29 @@ class DateUtils:
         Returns:
             List of (start, end) date tuples for each month
         """
-        ranges = []
-        current_start = start_date
-
-        while current_start <= end_date:
-            # Calculate end of current month
-            if current_start.month == 12:
-                current_end = date(current_start.year + 1, 1, 1) - date.resolution
-            else:
-                current_end = (
-                    date(current_start.year, current_start.month + 1, 1)
-                    - date.resolution
-                )
+        if start_date > end_date:
+            return []
 
-            # Adjust to not exceed the overall end date
-            if current_end > end_date:
-                current_end = end_date
+        month_count = (
+            (end_date.year - start_date.year) * 12
+            + end_date.month
+            - start_date.month
+            + 1
+        )
 
-            ranges.append((current_start, current_end))
+        ranges = []
+        for offset in range(month_count):
+            year_offset, month_index = divmod(start_date.month - 1 + offset, 12)
+            year = start_date.year + year_offset
+            month = month_index + 1
 
-            # Move to next month
-            if current_start.month == 12:
-                current_start = date(current_start.year + 1, 1, 1)
-            else:
-                current_start = date(current_start.year, current_start.month + 1, 1)
+            # First range starts at start_date, the rest on the 1st of the month
+            range_start = start_date if offset == 0 else date(year, month, 1)
+            # Adjust to not exceed the overall end date
+            range_end = min(
+                date(year, month, calendar.monthrange(year, month)[1]), end_date
+            )
+            ranges.append((range_start, range_end))
 
         return ranges
 
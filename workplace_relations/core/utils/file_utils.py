@@ -3,10 +3,40 @@ File utility functions for the workplace relations scraper.
 """
 
 import os
+import re
 import hashlib
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from urllib.parse import urlparse
 
+# Anything other than word characters, space, dot, underscore or hyphen
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w .\-]+")
+
+# URL path suffixes (after the last dot) mapped to file extensions
+_URL_EXTENSIONS = {
+    "pdf": "pdf",
+    "docx": "docx",
+    "doc": "doc",
+    "html": "html",
+    "htm": "html",
+}
+
+# MIME types (content type without parameters) mapped to file extensions
+_MIME_EXTENSIONS = {
+    "application/pdf": "pdf",
+    "application/msword": "doc",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+    "text/html": "html",
+    "application/xhtml+xml": "html",
+}
+
+# Content type substrings checked in order, for MIME types not listed above
+_CONTENT_TYPE_TOKENS = (
+    ("pdf", "pdf"),
+    ("docx", "docx"),
+    ("msword", "doc"),
+    ("html", "html"),
+)
+
 
 class FileUtils:
     """Utility class for file operations."""
@@ -26,9 +56,8 @@ class FileUtils:
         if not filename:
             return "unnamed"
 
-        # Remove or replace invalid characters
-        keepchars = (" ", ".", "_", "-")
-        sanitized = "".join(c for c in filename if c.isalnum() or c in keepchars)
+        # Remove invalid characters
+        sanitized = _UNSAFE_FILENAME_CHARS.sub("", filename)
 
         # Remove leading/trailing spaces and dots
         sanitized = sanitized.strip(" .")
@@ -58,32 +87,38 @@ class FileUtils:
             File extension (without dot)
         """
         # Try to get extension from URL
-        parsed_url = urlparse(url)
-        path = parsed_url.path.lower()
-
-        if path.endswith(".pdf"):
-            return "pdf"
-        elif path.endswith(".docx"):
-            return "docx"
-        elif path.endswith(".doc"):
-            return "doc"
-        elif path.endswith(".html") or path.endswith(".htm"):
-            return "html"
-
-        # Try to get extension from content type
-        if content_type:
-            content_type_lower = content_type.lower()
-            if "pdf" in content_type_lower:
-                return "pdf"
-            elif "docx" in content_type_lower:
-                return "docx"
-            elif "msword" in content_type_lower:
-                return "doc"
-            elif "html" in content_type_lower:
-                return "html"
-
-        # Default to html for web content
-        return "html"
+        path = urlparse(url).path.lower()
+        _, sep, suffix = path.rpartition(".")
+        # Only a dot in the last path segment starts an extension
+        if sep and "/" not in suffix:
+            extension = _URL_EXTENSIONS.get(suffix)
+            if extension:
+                return extension
+
+        # Try to get extension from content type, defaulting to html
+        return FileUtils.get_content_type_extension(content_type) or "html"
+
+    @staticmethod
+    def get_content_type_extension(content_type: Optional[str]) -> Optional[str]:
+        """
+        Determine file extension from an HTTP content type.
+
+        Args:
+            content_type: HTTP content type, possibly with parameters
+
+        Returns:
+            File extension (without dot), or None if not recognised
+        """
+        if not content_type:
+            return None
+        content_type_lower = content_type.lower()
+        extension = _MIME_EXTENSIONS.get(content_type_lower.partition(";")[0].strip())
+        if extension:
+            return extension
+        for token, extension in _CONTENT_TYPE_TOKENS:
+            if token in content_type_lower:
+                return extension
+        return None
 
     @staticmethod
     def calculate_file_hash(content: bytes, algorithm: str = "sha256") -> str:
@@ -104,6 +139,29 @@ class FileUtils:
         else:
             raise ValueError(f"Unsupported hash algorithm: {algorithm}")
 
+    @staticmethod
+    def calculate_path_hash(file_path: str, algorithm: str = "sha256") -> str:
+        """
+        Calculate hash of a file on disk without reading it into memory.
+
+        Args:
+            file_path: Path to file
+            algorithm: Hash algorithm to use
+
+        Returns:
+            Hexadecimal hash string
+        """
+        if algorithm not in ("sha256", "md5"):
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+        with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            hasher = hashlib.new(algorithm)
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+
     @staticmethod
     def ensure_directory_exists(directory_path: str) -> bool:
         """
@@ -139,6 +197,37 @@ class FileUtils:
         except Exception:
             return None
 
+    @staticmethod
+    def iter_files_in_directory(
+        directory_path: str, extensions: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """
+        Iterate over files in directory with optional extension filter.
+
+        Uses os.scandir so file type checks come from the cached directory
+        entry instead of a stat call per file.
+
+        Args:
+            directory_path: Path to directory
+            extensions: List of file extensions to include (without dot)
+
+        Yields:
+            File paths
+        """
+        ext_set = frozenset(ext.lower() for ext in extensions) if extensions else None
+        try:
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    if ext_set is not None:
+                        file_ext = os.path.splitext(entry.name)[1][1:].lower()
+                        if file_ext not in ext_set:
+                            continue
+                    yield entry.path
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
     @staticmethod
     def list_files_in_directory(
         directory_path: str, extensions: Optional[List[str]] = None
@@ -153,21 +242,7 @@ class FileUtils:
         Returns:
             List of file paths
         """
-        if not os.path.exists(directory_path):
-            return []
-
-        files = []
-        for filename in os.listdir(directory_path):
-            file_path = os.path.join(directory_path, filename)
-            if os.path.isfile(file_path):
-                if extensions:
-                    file_ext = os.path.splitext(filename)[1][1:].lower()
-                    if file_ext in extensions:
-                        files.append(file_path)
-                else:
-                    files.append(file_path)
-
-        return files
+        return list(FileUtils.iter_files_in_directory(directory_path, extensions))
 
     @staticmethod
     def is_valid_file_type(filename: str, allowed_extensions: List[str]) -> bool:
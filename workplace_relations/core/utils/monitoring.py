@@ -12,7 +12,7 @@ from workplace_relations.config import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Class to track performance metrics."""
 
@@ -21,6 +21,7 @@ class PerformanceMetrics:
     documents_processed: int = 0
     documents_failed: int = 0
     memory_usage_mb: float = 0.0
+    peak_memory_usage_mb: float = 0.0
     cpu_usage_percent: float = 0.0
 
 
@@ -29,12 +30,22 @@ class ScraperMonitor:
 
     def __init__(self):
         self.metrics = PerformanceMetrics(start_time=time.time())
+        # Durations use the monotonic clock; wall-clock times are for display
+        self._start_monotonic = time.monotonic()
         self.process = psutil.Process()
+        self._sample_interval = 1.0  # seconds
+        self._last_sample = 0.0
+        # The first cpu_percent call only primes the measurement
+        self.process.cpu_percent(interval=None)
 
     def update_metrics(self) -> None:
         """Update current system metrics."""
-        self.metrics.memory_usage_mb = self.process.memory_info().rss / (1024 * 1024)
-        self.metrics.cpu_usage_percent = self.process.cpu_percent()
+        self._last_sample = time.monotonic()
+        memory_usage_mb = self.process.memory_info().rss / (1024 * 1024)
+        self.metrics.memory_usage_mb = memory_usage_mb
+        if memory_usage_mb > self.metrics.peak_memory_usage_mb:
+            self.metrics.peak_memory_usage_mb = memory_usage_mb
+        self.metrics.cpu_usage_percent = self.process.cpu_percent(interval=None)
 
     def document_processed(self, success: bool = True) -> None:
         """Record document processing attempt."""
@@ -42,14 +53,16 @@ class ScraperMonitor:
             self.metrics.documents_processed += 1
         else:
             self.metrics.documents_failed += 1
-        self.update_metrics()
+        # Sample system metrics at most once per interval
+        if time.monotonic() - self._last_sample >= self._sample_interval:
+            self.update_metrics()
 
     def finalize(self) -> Dict[str, Any]:
         """Finalize metrics and return results."""
         self.metrics.end_time = time.time()
         self.update_metrics()
 
-        elapsed = self.metrics.end_time - self.metrics.start_time
+        elapsed = time.monotonic() - self._start_monotonic
         docs_per_sec = self.metrics.documents_processed / elapsed if elapsed > 0 else 0
 
         return {
@@ -71,7 +84,7 @@ class ScraperMonitor:
                 else 1.0
             ),
             "documents_per_second": round(docs_per_sec, 2),
-            "peak_memory_usage_mb": round(self.metrics.memory_usage_mb, 2),
+            "peak_memory_usage_mb": round(self.metrics.peak_memory_usage_mb, 2),
             "average_cpu_usage_percent": round(self.metrics.cpu_usage_percent, 2),
         }
 
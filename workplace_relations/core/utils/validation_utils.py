@@ -0,0 +1,126 @@
+"""
+Validation utility functions for the workplace relations scraper.
+
+These checks are stricter than Document.validate, which only requires the
+fields the pipelines key on: identifiers come from result link titles, and
+rejecting an unusual title there would silently drop a real document. They
+are exported for auditing stored data and ad-hoc checks instead.
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List
+from urllib.parse import urlparse
+
+from workplace_relations.config import settings
+from .date_utils import DateUtils
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_IDENTIFIER_RE = re.compile(r"^[a-zA-Z0-9\s\-_.,()]+$")
+_PARTITION_DATE_RE = re.compile(r"^\d{4}-\d{2}$")
+_INVALID_FILENAME_CHARS = frozenset('<>:"/\\|?*')
+
+REQUIRED_DOCUMENT_FIELDS = ("identifier", "body", "partition_date")
+
+
+class ValidationUtils:
+    """Utility class for validating scraped data."""
+
+    @staticmethod
+    def is_valid_email(email: str) -> bool:
+        """
+        Check if string is a valid email address.
+
+        Args:
+            email: Email address to check
+
+        Returns:
+            True if valid, False otherwise
+        """
+        return bool(email) and _EMAIL_RE.match(email) is not None
+
+    @staticmethod
+    def is_valid_identifier(identifier: str) -> bool:
+        """
+        Check if string is a valid document identifier.
+
+        Args:
+            identifier: Identifier to check (e.g. "ADJ-00012345")
+
+        Returns:
+            True if valid, False otherwise
+        """
+        return bool(identifier) and _IDENTIFIER_RE.match(identifier) is not None
+
+    @staticmethod
+    def is_valid_filename(filename: str) -> bool:
+        """
+        Check if filename contains no reserved characters.
+
+        Args:
+            filename: Filename to check
+
+        Returns:
+            True if valid, False otherwise
+        """
+        return bool(filename) and not _INVALID_FILENAME_CHARS.intersection(filename)
+
+    @staticmethod
+    def is_valid_url(url: str) -> bool:
+        """
+        Check if string is an absolute HTTP(S) URL.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            True if valid, False otherwise
+        """
+        if not url:
+            return False
+        parsed = urlparse(url)
+        return parsed.scheme in ("http", "https") and bool(parsed.netloc)
+
+    @staticmethod
+    def validate_document_data(data: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Validate raw document data.
+
+        Args:
+            data: Document data dictionary
+
+        Returns:
+            Dictionary mapping field names to lists of error messages
+            (empty if the data is valid)
+        """
+        errors: DefaultDict[str, List[str]] = defaultdict(list)
+
+        # Look each required field up once; format checks below only run on
+        # fields that are present
+        required = {field: data.get(field) for field in REQUIRED_DOCUMENT_FIELDS}
+        for field, value in required.items():
+            if not value:
+                errors[field].append("Field is required")
+
+        identifier = required["identifier"]
+        partition_date = required["partition_date"]
+
+        if identifier and not ValidationUtils.is_valid_identifier(identifier):
+            errors["identifier"].append("Invalid identifier format")
+
+        if partition_date and not _PARTITION_DATE_RE.match(partition_date):
+            errors["partition_date"].append("Partition date must be in YYYY-MM format")
+
+        published_date = data.get("published_date")
+        if published_date and DateUtils.parse_date(published_date) is None:
+            errors["published_date"].append("Unparseable date")
+
+        link_to_doc = data.get("link_to_doc")
+        if link_to_doc and not ValidationUtils.is_valid_url(link_to_doc):
+            errors["link_to_doc"].append("Invalid URL")
+
+        file_type = data.get("file_type")
+        if file_type and file_type not in settings.SUPPORTED_FILE_TYPES:
+            errors["file_type"].append(f"Unsupported file type: {file_type}")
+
+        return dict(errors)
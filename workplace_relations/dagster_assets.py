@@ -3,19 +3,61 @@ Dagster assets for scraping and processing workplace relations documents.
 Refactored to use the new architecture and separation of concerns.
 """
 
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
 from dagster import asset, Output, OpExecutionContext
 from workplace_relations.config import settings, get_logger
-from workplace_relations.core import DocumentService
+from workplace_relations.core.services.document_service import (
+    process_document_in_worker,
+)
+from workplace_relations.core import DateUtils, Document
 from workplace_relations.repositories import MongoRepository
 
 logger = get_logger(__name__)
 
-document_service = DocumentService()
+# Processed documents written to MongoDB per insert request
+INSERT_BATCH_SIZE = 1000
+
+# Documents sent to a worker process per task
+PROCESS_CHUNKSIZE = 16
+
+# Runs at least this large may rebuild processed indexes after inserting
+REBUILD_INDEXES_MIN_DOCUMENTS = 10_000
+
 landing_repo = MongoRepository(collection_name=settings.MONGO_LANDING_COLLECTION)
 processed_repo = MongoRepository(collection_name=settings.MONGO_PROCESSED_COLLECTION)
 
 
+def _latest_by_identifier(
+    documents: Iterable[Document],
+) -> Tuple[List[Document], int]:
+    """
+    Drop duplicate identifiers in one pass, keeping the most recently
+    published copy (the first one seen wins ties).
+
+    Returns the kept documents and the number of documents read.
+    """
+
+    def published(doc: Document) -> date:
+        if doc.published_dt:
+            return doc.published_dt.date()
+        return DateUtils.parse_date(doc.published_date) or date.min
+
+    latest: Dict[str, Document] = {}
+    latest_dates: Dict[str, date] = {}
+    found = 0
+    for doc in documents:
+        found += 1
+        doc_date = published(doc)
+        if doc.identifier not in latest or doc_date > latest_dates[doc.identifier]:
+            latest[doc.identifier] = doc
+            latest_dates[doc.identifier] = doc_date
+    return list(latest.values()), found
+
+
 @asset(required_resource_keys={"scrapy_runner"})
 def scrape_and_store_landing_zone(context: OpExecutionContext):
     config = context.op_config or {}
@@ -47,44 +89,95 @@ def transform_landing_zone_documents(context: OpExecutionContext):
     start_date = config.get("start_date")
     end_date = config.get("end_date")
 
-    # Convert dates using DateUtils
-    from workplace_relations.core.utils.date_utils import DateUtils
-
     query_start = DateUtils.parse_date(start_date)
     query_end = DateUtils.parse_date(end_date)
 
     context.log.info(f"Looking for documents between {query_start} and {query_end}")
 
     # Fetch documents from landing zone
-    documents = landing_repo.find_by_date_range(query_start, query_end)
-    context.log.info(f"Found {len(documents)} documents to process")
-
-    processed_docs = []
+    # Documents from before published_dt existed can get it stored once (a
+    # one-off migration, enabled with backfill_published_dt), so the range
+    # query below doesn't have to parse their date strings
+    if config.get("backfill_published_dt", False):
+        landing_repo.backfill_published_dt()
+
+    # Only the latest copy of each identifier is transformed; the others
+    # would be rejected by the unique identifier index after being processed
+    documents, found = _latest_by_identifier(
+        landing_repo.find_by_date_range(query_start, query_end)
+    )
+    context.log.info(
+        f"Found {found} documents to process "
+        f"({found - len(documents)} duplicates skipped)"
+    )
 
-    for doc in documents:
-        try:
-            # Process document using DocumentService
-            processed_doc = document_service.process_document(doc)
+    processed_count = inserted = replaced = 0
+    pending_docs = []
+
+    def store(docs: List[Document]) -> None:
+        # Upserts keyed on identifier, so rerunning a range replaces the
+        # earlier output instead of failing on the unique index
+        nonlocal inserted, replaced
+        batch_inserted, batch_replaced = processed_repo.upsert_many(
+            docs, INSERT_BATCH_SIZE
+        )
+        inserted += batch_inserted
+        replaced += batch_replaced
+
+    # With rebuild_indexes set, large runs write into a collection indexed only
+    # on identifier and build the other indexes once at the end instead of
+    # updating them per document
+    rebuild_indexes = (
+        config.get("rebuild_indexes", False)
+        and len(documents) > REBUILD_INDEXES_MIN_DOCUMENTS
+    )
+    # Collections written before the unique identifier index existed may hold
+    # duplicates; they are removed once, before the index is first built
+    if rebuild_indexes:
+        processed_repo.drop_secondary_indexes()
+        processed_repo.ensure_unique_identifier_index(remove_duplicates=True)
+    else:
+        processed_repo.ensure_indexes(unique_identifier=True, remove_duplicates=True)
+
+    # Parsing and hashing are CPU-bound, so documents are processed across
+    # worker processes. Workers are spawned rather than forked, since forking
+    # after the MongoDB clients have started their threads is unsafe.
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        results = executor.map(
+            process_document_in_worker, documents, chunksize=PROCESS_CHUNKSIZE
+        )
+        for doc, processed_doc in zip(documents, results):
             if processed_doc:
+                processed_count += 1
+                pending_docs.append(processed_doc)
                 # Store processed document metadata in processed collection
-                processed_repo.create(processed_doc)
-                processed_docs.append(processed_doc)
+                if len(pending_docs) >= INSERT_BATCH_SIZE:
+                    store(pending_docs)
+                    pending_docs = []
             else:
                 context.log.warning(f"Failed to process document: {doc.identifier}")
-        except Exception as e:
-            context.log.error(
-                f"Failed to process document {getattr(doc, 'identifier', None)}: {str(e)}"
-            )
-            continue
+
+    if pending_docs:
+        store(pending_docs)
+
+    if rebuild_indexes:
+        processed_repo.ensure_indexes(unique_identifier=True)
 
     return Output(
         value={
-            "processed_count": len(processed_docs),
+            "processed_count": processed_count,
+            "inserted_count": inserted,
+            "replaced_count": replaced,
             "start_date": start_date,
             "end_date": end_date,
         },
         metadata={
-            "processed_documents": len(processed_docs),
+            "processed_documents": processed_count,
+            "inserted_documents": inserted,
+            "replaced_documents": replaced,
             "processed_storage_path": os.path.abspath(settings.PROCESSED_STORAGE_BASE),
             "mongo_collection": settings.MONGO_PROCESSED_COLLECTION,
         },
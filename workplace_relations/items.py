@@ -1,11 +1,38 @@
 """
-Scrapy Item definition for compatibility.
+Scrapy Item definitions for compatibility.
 For business logic, use workplace_relations.core.models.document.Document.
 """
 
+from dataclasses import dataclass
+from typing import Optional
+
 import scrapy
 
 
+@dataclass(slots=True)
+class WorkplaceRelationsRecord:
+    """
+    Item yielded by the spider.
+
+    A slotted dataclass avoids the per-field checks of scrapy.Item on every
+    assignment; pipelines read it through ItemAdapter like any other item.
+    """
+
+    identifier: Optional[str] = None
+    description: Optional[str] = None
+    published_date: Optional[str] = None
+    link_to_doc: Optional[str] = None
+    partition_date: Optional[str] = None
+    body: Optional[str] = None
+    file_path: Optional[str] = None
+    file_hash: Optional[str] = None
+    file_type: Optional[str] = None
+    # Set by the processing pipeline
+    original_file_path: Optional[str] = None
+    processed_at: Optional[str] = None
+    processing_version: Optional[str] = None
+
+
 class WorkplaceRelationsItem(scrapy.Item):
     identifier = scrapy.Field()
     description = scrapy.Field()
@@ -2,15 +2,39 @@
 Abstract base pipeline for Scrapy item processing.
 """
 
+import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Tuple
 from itemadapter import ItemAdapter
 from scrapy import Spider
+from scrapy.exceptions import DropItem
 
 from workplace_relations.config import get_logger
 
 logger = get_logger(__name__)
 
+# Field names of the dataclass item types seen so far
+_DATACLASS_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _item_to_dict(item: Any) -> Dict[str, Any]:
+    """
+    Copy an item's fields into a dict.
+
+    Dataclass items (such as the spider's WorkplaceRelationsRecord) are read
+    field by field using names cached per type, which is much cheaper than
+    going through ItemAdapter; other item types use ItemAdapter.
+    """
+    item_type = type(item)
+    names = _DATACLASS_FIELDS.get(item_type)
+    if names is None and is_dataclass(item):
+        names = _DATACLASS_FIELDS[item_type] = tuple(f.name for f in fields(item))
+    if names is not None:
+        return {name: getattr(item, name) for name in names}
+    return ItemAdapter(item).asdict()
+
 
 class BasePipeline(ABC):
     """
@@ -20,6 +44,9 @@ class BasePipeline(ABC):
 
     def __init__(self):
         self.logger = logger
+        # Dict view of the item currently being processed on this thread,
+        # shared by the hooks instead of each rebuilding it
+        self._local = threading.local()
 
     def open_spider(self, spider: Spider):
         """Called when spider opens. Template method hook."""
@@ -42,9 +69,13 @@ class BasePipeline(ABC):
         Returns:
             Processed item
         """
+        self._local.item = item
+        self._local.item_dict = _item_to_dict(item)
         try:
-            # Pre-processing hook
+            # Pre-processing hook; returning None drops the item
             item = self._pre_process_item(item, spider)
+            if item is None:
+                raise DropItem(f"Item skipped by {self.__class__.__name__}")
 
             # Main processing
             item = self._process_item(item, spider)
@@ -54,11 +85,15 @@ class BasePipeline(ABC):
 
             return item
 
+        except DropItem:
+            raise
         except Exception as e:
             self.logger.error(
                 f"Error processing item in {self.__class__.__name__}: {e}"
             )
             return self._handle_error(item, spider, e)
+        finally:
+            self._local.item = self._local.item_dict = None
 
     @abstractmethod
     def _process_item(self, item: Any, spider: Spider) -> Any:
@@ -83,7 +118,11 @@ class BasePipeline(ABC):
         pass
 
     def _pre_process_item(self, item: Any, spider: Spider) -> Any:
-        """Pre-processing hook. Override if needed."""
+        """
+        Pre-processing hook. Override if needed.
+
+        Return None to drop the item; later pipelines won't see it.
+        """
         return item
 
     def _post_process_item(self, item: Any, spider: Spider) -> Any:
@@ -96,13 +135,25 @@ class BasePipeline(ABC):
         return item
 
     def _get_item_dict(self, item: Any) -> Dict[str, Any]:
-        """Convert item to dictionary."""
-        return ItemAdapter(item).asdict()
+        """
+        Convert item to dictionary.
+
+        Within process_item the same dict is returned for the item on every
+        call, so changes made to it by one hook are seen by the next.
+        """
+        if item is getattr(self._local, "item", None):
+            return self._local.item_dict
+        return _item_to_dict(item)
 
     def _log_item_processing(self, item: Any, spider: Spider, stage: str):
         """Log item processing stage."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         item_dict = self._get_item_dict(item)
         identifier = item_dict.get("identifier", "unknown")
         self.logger.debug(
-            f"Processing item {identifier} in {self.__class__.__name__} - {stage}"
+            "Processing item %s in %s - %s",
+            identifier,
+            self.__class__.__name__,
+            stage,
         )
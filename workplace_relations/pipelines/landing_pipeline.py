@@ -2,16 +2,28 @@
 Landing pipeline for initial document processing and storage.
 """
 
-from typing import Any, Optional
-from pymongo import MongoClient
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from datetime import datetime, time
+from time import monotonic
+from itemadapter import ItemAdapter
+from pymongo import InsertOne, MongoClient, WriteConcern
 from scrapy import Spider
+from twisted.internet.threads import deferToThread
 
 from .base_pipeline import BasePipeline
-from workplace_relations.core import Document, StorageService
+from workplace_relations.core import DateUtils, Document, StorageService
 from workplace_relations.config import settings, get_logger
+from workplace_relations.repositories import MongoRepository, get_mongo_client
 
 logger = get_logger(__name__)
 
+# Per-item logs are at DEBUG; progress is reported at INFO every N items
+_PROGRESS_LOG_INTERVAL = 100
+
+_SANITIZED_FIELDS = ("identifier", "description", "body")
+
 
 class LandingPipeline(BasePipeline):
     """
@@ -24,27 +36,102 @@ class LandingPipeline(BasePipeline):
         self.storage_service = StorageService()
         self.mongo_client: Optional[MongoClient] = None
         self.mongo_collection = None
+        self.repository: Optional[MongoRepository] = None
         self.mongo_config = settings.get_mongo_config()
+        # Documents waiting to be written to MongoDB in one bulk request
+        self._pending_documents: List[Dict[str, Any]] = []
+        self.batch_size = settings.MONGO_BATCH_SIZE
+        self.flush_interval = settings.MONGO_FLUSH_INTERVAL
+        self._last_flush = monotonic()
+        self._processed_count = 0
+        # Source URLs in the landing collection (preloaded for the crawl's
+        # months) or written during this crawl, and URLs whose download or
+        # batch write is still in progress
+        self._seen_urls: Set[str] = set()
+        self._claimed_urls: Set[str] = set()
+        # Items are processed on reactor worker threads; guards shared state
+        self._lock = threading.Lock()
+        # Full batches are written in the background so the item that filled
+        # the batch doesn't wait on MongoDB; one worker keeps writes in order
+        self._write_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="landing-mongo"
+        )
+        # Background batch writes not yet checked for failure
+        self._write_futures: List[Tuple[Future, List[Dict[str, Any]]]] = []
 
     def _setup_pipeline(self, spider: Spider):
         """Setup MongoDB connection and storage."""
         try:
-            self.mongo_client = MongoClient(self.mongo_config["uri"])
+            self.mongo_client = get_mongo_client(self.mongo_config["uri"])
             db = self.mongo_client[self.mongo_config["database"]]
-            self.mongo_collection = db[self.mongo_config["landing_collection"]]
+            self.mongo_collection = db.get_collection(
+                self.mongo_config["landing_collection"],
+                write_concern=WriteConcern(w=settings.MONGO_LANDING_WRITE_CONCERN),
+            )
             self.logger.info("Connected to MongoDB for landing pipeline")
         except Exception as e:
             self.logger.error(f"Failed to connect to MongoDB: {e}")
             raise
 
+        # Lookups and index creation go through the repository, whose writes
+        # are acknowledged
+        self.repository = MongoRepository(self.mongo_config["landing_collection"])
+        self.repository.ensure_indexes()
+        self._preload_known_urls(spider)
+
+    def _preload_known_urls(self, spider: Spider):
+        """
+        Load the source URLs already in the landing collection.
+
+        One projected query up front replaces a MongoDB round trip per item
+        on the reactor's thread pool. When the spider has a date range, only
+        the partitions (months) it will crawl are loaded; URLs stored under
+        other partitions are downloaded again.
+        """
+        filters: Dict[str, Any] = {}
+        config = getattr(spider, "config", None)
+        if config is not None:
+            filters["partition_date"] = {
+                "$gte": config.start_date.strftime("%Y-%m"),
+                "$lte": config.end_date.strftime("%Y-%m"),
+            }
+        try:
+            urls = {
+                url
+                for url in self.repository.find_field_values("link_to_doc", filters)
+                if url
+            }
+        except Exception as e:
+            # Every URL then looks new, as when the landing collection is empty
+            self.logger.warning(f"Failed to load known source URLs: {e}")
+            return
+        with self._lock:
+            self._seen_urls.update(urls)
+        self.logger.info(f"Loaded {len(urls)} known source URLs")
+
     def _cleanup_pipeline(self, spider: Spider):
-        """Cleanup MongoDB connection."""
+        """Flush pending documents and cleanup storage."""
+        self.storage_service.close()
+        self._write_pool.shutdown(wait=True)
+        self._check_writes()
+        with self._lock:
+            documents = self._pending_documents
         try:
-            if self.mongo_client:
-                self.mongo_client.close()
-                self.logger.info("Closed MongoDB connection")
+            self._flush_documents()
         except Exception as e:
-            self.logger.error(f"Error closing MongoDB connection: {e}")
+            self._log_failed_write(documents, e)
+        # The MongoDB client is shared process-wide, so it stays open
+        self.mongo_client = None
+
+    def process_item(self, item: Any, spider: Spider):
+        """
+        Process item on a reactor worker thread.
+
+        Downloads block on network I/O, so returning a Deferred lets Scrapy
+        keep several items in flight over the shared HTTP session instead of
+        stalling the pipeline on each download.
+        """
+        return deferToThread(super().process_item, item, spider)
 
     def _process_item(self, item: Any, spider: Spider) -> Any:
         """
@@ -60,7 +147,7 @@ class LandingPipeline(BasePipeline):
         item_dict = self._get_item_dict(item)
         identifier = item_dict.get("identifier", "unknown")
 
-        self.logger.info(f"Processing item: {identifier}")
+        self.logger.debug("Processing item: %s", identifier)
 
         try:
             # Convert to Document model
@@ -71,9 +158,29 @@ class LandingPipeline(BasePipeline):
                 self.logger.warning(f"Invalid document data for {identifier}")
                 return item
 
-            # Download and store file
-            file_info = self.storage_service.download_and_store_document(document)
-            if file_info:
+            # Skip documents already stored in this crawl or a previous one;
+            # they pass on without file information, which later pipelines skip
+            url = document.link_to_doc
+            if self._is_known_url(url):
+                self.logger.debug("Document %s already in landing zone", identifier)
+                return item
+
+            stored = False
+            try:
+                # Store the publication date as a datetime for indexed queries
+                published = DateUtils.parse_date(document.published_date)
+                if published:
+                    document.published_dt = datetime.combine(published, time.min)
+
+                # Download and store file; failed downloads get no landing
+                # record, so a later crawl retries them
+                file_info = self.storage_service.download_and_store_document(document)
+                if not file_info:
+                    self.logger.warning(
+                        f"Failed to download document {identifier}, not storing it"
+                    )
+                    return item
+
                 # Update document with file information
                 document.file_path = file_info["file_path"]
                 document.file_hash = file_info["file_hash"]
@@ -82,31 +189,137 @@ class LandingPipeline(BasePipeline):
                 # Update item with file information
                 item_dict.update(file_info)
 
-            # Store in MongoDB
-            self._store_in_mongodb(document)
+                # Store in MongoDB
+                self._store_in_mongodb(document)
+                stored = True
 
-            # Update item with any additional processing
-            self._update_item_from_document(item, document)
+                # Update item with any additional processing
+                self._update_item_from_document(item, document)
 
-            return item
+                return item
+            finally:
+                # Once queued, the URL is released by the batch write instead
+                if not stored:
+                    self._release_urls([url], stored=False)
 
         except Exception as e:
             self.logger.error(f"Failed to process item {identifier}: {e}")
             raise
 
+    def _is_known_url(self, url: Optional[str]) -> bool:
+        """
+        Claim a source URL for download.
+
+        Returns True if the URL was in the landing collection when the crawl
+        started, was stored during this crawl, or is being downloaded or
+        written by another item. Otherwise the URL is claimed until
+        _release_urls is called.
+
+        The skip is best-effort. Landing writes are unacknowledged by default
+        (MONGO_LANDING_WRITE_CONCERN=0), so a URL whose earlier batch was lost
+        looks new and is downloaded again. A URL that is in the collection is
+        trusted without checking that its file is still on disk.
+        """
+        if not url:
+            return False
+        with self._lock:
+            if url in self._seen_urls or url in self._claimed_urls:
+                return True
+            self._claimed_urls.add(url)
+        return False
+
+    def _release_urls(self, urls: Iterable[Optional[str]], stored: bool):
+        """Release claimed URLs, remembering them if their documents were stored."""
+        with self._lock:
+            for url in urls:
+                if not url:
+                    continue
+                self._claimed_urls.discard(url)
+                if stored:
+                    self._seen_urls.add(url)
+
     def _store_in_mongodb(self, document: Document):
-        """Store document metadata in MongoDB."""
+        """Queue document metadata for a batched MongoDB insert."""
+        document_dict = document.to_dict()
+        documents = None
+        now = monotonic()
+        with self._lock:
+            self._pending_documents.append(document_dict)
+            # Slow crawls still write at least every flush_interval seconds
+            if (
+                len(self._pending_documents) >= self.batch_size
+                or now - self._last_flush >= self.flush_interval
+            ):
+                documents, self._pending_documents = self._pending_documents, []
+                self._last_flush = now
+        if documents:
+            self._check_writes(wait=False)
+            future = self._write_pool.submit(self._write_documents, documents)
+            with self._lock:
+                self._write_futures.append((future, documents))
+
+    def _check_writes(self, wait: bool = True):
+        """
+        Log background batch writes that failed.
+
+        Args:
+            wait: Check every write, including ones still running; otherwise
+                only finished writes are checked and the rest kept for later
+        """
+        finished = []
+        with self._lock:
+            futures, self._write_futures = self._write_futures, []
+            for entry in futures:
+                if wait or entry[0].done():
+                    finished.append(entry)
+                else:
+                    self._write_futures.append(entry)
+        for future, documents in finished:
+            error = future.exception()
+            if error is not None:
+                self._log_failed_write(documents, error)
+
+    def _log_failed_write(self, documents: List[Dict[str, Any]], error: Exception):
+        """Log a batch write that failed, naming the documents it held."""
+        identifiers = ", ".join(
+            str(document.get("identifier")) for document in documents
+        )
+        self.logger.error(
+            f"Failed to store {len(documents)} documents in MongoDB ({error}): "
+            f"{identifiers}"
+        )
+
+    def _flush_documents(self):
+        """Write any queued document metadata to MongoDB."""
+        with self._lock:
+            documents, self._pending_documents = self._pending_documents, []
+        if documents:
+            self._write_documents(documents)
+
+    def _write_documents(self, documents: List[Dict[str, Any]]):
+        """
+        Write document metadata to MongoDB in one unordered bulk insert.
+
+        With the default unacknowledged write concern, the server reports
+        nothing back, so per-document failures can't be seen here. The
+        documents' URLs count as stored only once the batch is handed off
+        without error; after a failure they can be downloaded again.
+        """
+        urls = [document.get("link_to_doc") for document in documents]
         try:
-            document_dict = document.to_dict()
-            result = self.mongo_collection.insert_one(document_dict)
-            self.logger.info(
-                f"Stored document {document.identifier} (ID: {result.inserted_id})"
-            )
-        except Exception as e:
-            self.logger.error(
-                f"Failed to store document {document.identifier} in MongoDB: {e}"
+            result = self.mongo_collection.bulk_write(
+                [InsertOne(document) for document in documents], ordered=False
             )
+            if result.acknowledged:
+                self.logger.info(f"Stored {result.inserted_count} documents in MongoDB")
+            else:
+                self.logger.info(
+                    f"Sent {len(documents)} documents to MongoDB (unacknowledged)"
+                )
+        except Exception:
+            self._release_urls(urls, stored=False)
             raise
+        self._release_urls(urls, stored=True)
 
     def _update_item_from_document(self, item: Any, document: Document):
         """Update Scrapy item with document data."""
@@ -127,10 +340,12 @@ class LandingPipeline(BasePipeline):
             self.logger.warning("Item missing identifier")
             return item
 
-        # Sanitize string fields
-        for field in ["identifier", "description", "body"]:
-            if field in item_dict and item_dict[field]:
-                item_dict[field] = item_dict[field].strip()
+        # Sanitize string fields on the item itself and on the shared dict
+        adapter = ItemAdapter(item)
+        for field in _SANITIZED_FIELDS:
+            value = item_dict.get(field)
+            if isinstance(value, str):
+                item_dict[field] = adapter[field] = value.strip()
 
         return item
 
@@ -139,11 +354,16 @@ class LandingPipeline(BasePipeline):
         item_dict = self._get_item_dict(item)
         identifier = item_dict.get("identifier", "unknown")
 
-        self.logger.info(f"Successfully processed item: {identifier}")
+        self.logger.debug("Successfully processed item: %s", identifier)
 
-        # Update spider statistics if available
-        if hasattr(spider, "document_count"):
-            spider.document_count += 1
+        with self._lock:
+            # Update spider statistics if available
+            if hasattr(spider, "document_count"):
+                spider.document_count += 1
+            self._processed_count += 1
+            processed_count = self._processed_count
+        if processed_count % _PROGRESS_LOG_INTERVAL == 0:
+            self.logger.info(f"Processed {processed_count} items")
 
         return item
 
@@ -2,13 +2,18 @@
 Processing pipeline for document transformation and enrichment.
 """
 
-from typing import Any, Optional
-from pymongo import MongoClient
+import threading
+from time import monotonic
+from typing import Any, Dict, List, Optional
+from pymongo import MongoClient, ReplaceOne, WriteConcern
+from pymongo.errors import BulkWriteError
 from scrapy import Spider
+from twisted.internet.threads import deferToThread
 
 from .base_pipeline import BasePipeline
 from workplace_relations.core import Document, DocumentService
 from workplace_relations.config import settings, get_logger
+from workplace_relations.repositories import MongoRepository, get_mongo_client
 
 logger = get_logger(__name__)
 
@@ -25,26 +30,51 @@ class ProcessingPipeline(BasePipeline):
         self.mongo_client: Optional[MongoClient] = None
         self.mongo_collection = None
         self.mongo_config = settings.get_mongo_config()
+        # Processed documents waiting to be written to MongoDB in one bulk request
+        self._pending_documents: List[Dict[str, Any]] = []
+        self.batch_size = settings.MONGO_BATCH_SIZE
+        self.flush_interval = settings.MONGO_FLUSH_INTERVAL
+        self._last_flush = monotonic()
+        # Items are processed on reactor worker threads; guards shared state
+        self._lock = threading.Lock()
 
     def _setup_pipeline(self, spider: Spider):
         """Setup MongoDB connection for processed documents."""
         try:
-            self.mongo_client = MongoClient(self.mongo_config["uri"])
+            self.mongo_client = get_mongo_client(self.mongo_config["uri"])
             db = self.mongo_client[self.mongo_config["database"]]
-            self.mongo_collection = db[self.mongo_config["processed_collection"]]
+            self.mongo_collection = db.get_collection(
+                self.mongo_config["processed_collection"],
+                write_concern=WriteConcern(w=settings.MONGO_PROCESSED_WRITE_CONCERN),
+            )
             self.logger.info("Connected to MongoDB for processing pipeline")
         except Exception as e:
             self.logger.error(f"Failed to connect to MongoDB: {e}")
             raise
 
+        # Collections written before the unique index existed may hold
+        # duplicate identifiers, which would make the index build fail
+        MongoRepository(self.mongo_config["processed_collection"]).ensure_indexes(
+            unique_identifier=True, remove_duplicates=True
+        )
+
     def _cleanup_pipeline(self, spider: Spider):
-        """Cleanup MongoDB connection."""
+        """Flush pending documents and release the MongoDB connection."""
         try:
-            if self.mongo_client:
-                self.mongo_client.close()
-                self.logger.info("Closed MongoDB connection")
+            self._flush_documents()
         except Exception as e:
-            self.logger.error(f"Error closing MongoDB connection: {e}")
+            self.logger.error(f"Error flushing processed documents to MongoDB: {e}")
+        # The MongoDB client is shared process-wide, so it stays open
+        self.mongo_client = None
+
+    def process_item(self, item: Any, spider: Spider):
+        """
+        Process item on a reactor worker thread.
+
+        Parsing, file writes and MongoDB flushes all block, so returning a
+        Deferred keeps the reactor free for other items meanwhile.
+        """
+        return deferToThread(super().process_item, item, spider)
 
     def _process_item(self, item: Any, spider: Spider) -> Any:
         """
@@ -60,7 +90,13 @@ class ProcessingPipeline(BasePipeline):
         item_dict = self._get_item_dict(item)
         identifier = item_dict.get("identifier", "unknown")
 
-        self.logger.info(f"Processing item: {identifier}")
+        self.logger.debug("Processing item: %s", identifier)
+
+        # Items the landing pipeline skipped or could not download carry no
+        # file to process; pass them on unchanged
+        if not item_dict.get("file_path"):
+            self.logger.debug("Item %s has no stored file, skipping", identifier)
+            return item
 
         try:
             # Convert to Document model
@@ -68,7 +104,7 @@ class ProcessingPipeline(BasePipeline):
 
             # Check if document is already processed
             if document.is_processed():
-                self.logger.info(f"Document {identifier} already processed, skipping")
+                self.logger.debug("Document %s already processed, skipping", identifier)
                 return item
 
             # Process document
@@ -80,7 +116,7 @@ class ProcessingPipeline(BasePipeline):
                 # Update item with processed information
                 self._update_item_from_processed_document(item, processed_document)
 
-                self.logger.info(f"Successfully processed document: {identifier}")
+                self.logger.debug("Successfully processed document: %s", identifier)
             else:
                 self.logger.warning(f"Failed to process document: {identifier}")
 
@@ -91,16 +127,67 @@ class ProcessingPipeline(BasePipeline):
             raise
 
     def _store_processed_document(self, document: Document):
-        """Store processed document metadata in MongoDB."""
+        """Queue processed document metadata for a batched MongoDB write."""
+        document_dict = document.to_dict()
+        now = monotonic()
+        with self._lock:
+            self._pending_documents.append(document_dict)
+            # Slow crawls still write at least every flush_interval seconds
+            batch_ready = (
+                len(self._pending_documents) >= self.batch_size
+                or now - self._last_flush >= self.flush_interval
+            )
+            if batch_ready:
+                self._last_flush = now
+        if batch_ready:
+            self._flush_documents()
+
+    def _flush_documents(self):
+        """
+        Write queued processed documents to MongoDB in one unordered bulk write.
+
+        Documents are upserted keyed on identifier, like the transform asset
+        does, so reprocessing an identifier replaces its stored document.
+        """
+        with self._lock:
+            documents, self._pending_documents = self._pending_documents, []
+        if not documents:
+            return
+
         try:
-            document_dict = document.to_dict()
-            result = self.mongo_collection.insert_one(document_dict)
-            self.logger.info(
-                f"Stored processed document {document.identifier} (ID: {result.inserted_id})"
+            result = self.mongo_collection.bulk_write(
+                [
+                    ReplaceOne(
+                        {"identifier": document["identifier"]}, document, upsert=True
+                    )
+                    for document in documents
+                ],
+                ordered=False,
             )
+            if result.acknowledged:
+                self.logger.info(
+                    f"Inserted {result.upserted_count} and replaced "
+                    f"{result.matched_count} processed documents in MongoDB"
+                )
+            else:
+                self.logger.info(
+                    f"Sent {len(documents)} processed documents to MongoDB"
+                )
+        except BulkWriteError as e:
+            # Unordered writes carry on past failures; report them and keep going
+            written = e.details.get("nUpserted", 0) + e.details.get("nMatched", 0)
+            self.logger.error(
+                f"Stored {written} of {len(documents)} processed documents; "
+                f"{len(e.details.get('writeErrors', []))} failed"
+            )
+            for error in e.details.get("writeErrors", []):
+                identifier = documents[error["index"]].get("identifier")
+                self.logger.warning(
+                    f"Failed to store document {identifier}: {error.get('errmsg')}"
+                )
         except Exception as e:
             self.logger.error(
-                f"Failed to store processed document {document.identifier} in MongoDB: {e}"
+                f"Failed to store {len(documents)} processed documents in MongoDB: {e}"
             )
             raise
 
@@ -120,11 +207,6 @@ class ProcessingPipeline(BasePipeline):
         """Pre-processing: validate document for processing."""
         item_dict = self._get_item_dict(item)
 
-        # Check if document has required fields for processing
-        if not item_dict.get("file_path"):
-            self.logger.warning("Item missing file_path, skipping processing")
-            return None
-
         if not item_dict.get("identifier"):
             self.logger.warning("Item missing identifier")
             return item
@@ -133,17 +215,15 @@ class ProcessingPipeline(BasePipeline):
 
     def _post_process_item(self, item: Any, spider: Spider) -> Any:
         """Post-processing: log success and update statistics."""
-        if item is None:
-            return item
-
         item_dict = self._get_item_dict(item)
         identifier = item_dict.get("identifier", "unknown")
 
-        self.logger.info(f"Successfully completed processing for item: {identifier}")
+        self.logger.debug("Successfully completed processing for item: %s", identifier)
 
         # Update spider statistics if available
         if hasattr(spider, "processed_count"):
-            spider.processed_count += 1
+            with self._lock:
+                spider.processed_count += 1
 
         return item
 
@@ -4,6 +4,6 @@ Data access layer repositories for the workplace relations scraper.
 
 from .base_repository import BaseRepository
 from .document_repository import DocumentRepository
-from .mongo_repository import MongoRepository
+from .mongo_repository import MongoRepository, get_mongo_client
 
-__all__ = ['BaseRepository', 'DocumentRepository', 'MongoRepository'] 
\ No newline at end of file
+__all__ = ['BaseRepository', 'DocumentRepository', 'MongoRepository', 'get_mongo_client'] 
\ No newline at end of file
@@ -3,7 +3,8 @@ Abstract base repository for data access operations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Generic, TypeVar
+from itertools import islice
+from typing import Iterable, List, Optional, Dict, Any, Generic, TypeVar
 from datetime import datetime
 
 T = TypeVar("T")
@@ -26,10 +27,36 @@ class BaseRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def find_all(self, filters: Optional[Dict[str, Any]] = None) -> List[T]:
-        """Find all entities with optional filters."""
+    def find_all(self, filters: Optional[Dict[str, Any]] = None) -> Iterable[T]:
+        """
+        Find all entities with optional filters.
+
+        Implementations may stream results; use list() where a list is needed.
+        """
         pass
 
+    def _find_one(
+        self, filters: Dict[str, Any], projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[T]:
+        """
+        Find the first entity matching filters, fetching only projected fields.
+
+        The default takes the first find_all result and ignores projection;
+        override it with a single-entity query.
+        """
+        return next(iter(self.find_all(filters)), None)
+
+    def _find_page(
+        self, filters: Optional[Dict[str, Any]], skip: int, limit: int
+    ) -> List[T]:
+        """
+        Find at most limit entities after skipping skip, in a stable order.
+
+        The default walks find_all past the skipped entities; override it
+        with a server-side skip and limit.
+        """
+        return list(islice(self.find_all(filters), skip, skip + limit))
+
     @abstractmethod
     def update(self, entity: T) -> T:
         """Update an existing entity."""
@@ -47,21 +74,28 @@ class BaseRepository(ABC, Generic[T]):
 
     def find_by_field(self, field: str, value: Any) -> Optional[T]:
         """Find entity by field value."""
-        filters = {field: value}
-        results = self.find_all(filters)
-        return results[0] if results else None
+        return self._find_one({field: value})
+
+    def exists_by_field(self, field: str, value: Any) -> bool:
+        """Check if any entity has the given field value."""
+        return self.find_by_field(field, value) is not None
 
-    def find_by_fields(self, filters: Dict[str, Any]) -> List[T]:
+    def find_by_fields(self, filters: Dict[str, Any]) -> Iterable[T]:
         """Find entities by multiple field values."""
         return self.find_all(filters)
 
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
-        """Count entities with optional filters."""
-        return len(self.find_all(filters))
+        """
+        Count entities with optional filters.
+
+        The default streams find_all without keeping the results; override
+        it with a server-side count.
+        """
+        return sum(1 for _ in self.find_all(filters))
 
     def find_by_date_range(
         self, date_field: str, start_date: datetime, end_date: datetime
-    ) -> List[T]:
+    ) -> Iterable[T]:
         """Find entities within a date range."""
         filters = {date_field: {"$gte": start_date, "$lte": end_date}}
         return self.find_all(filters)
@@ -72,13 +106,15 @@ class BaseRepository(ABC, Generic[T]):
         page_size: int = 10,
         filters: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Find entities with pagination."""
-        all_results = self.find_all(filters)
-        total_count = len(all_results)
-
-        start_index = (page - 1) * page_size
-        end_index = start_index + page_size
-        paginated_results = all_results[start_index:end_index]
+        """
+        Find entities with pagination.
+
+        Only the requested page is loaded. Skipping still walks the skipped
+        entries, so for deep pages over large collections prefer paging on
+        the last seen _id instead.
+        """
+        total_count = self.count(filters)
+        paginated_results = self._find_page(filters, (page - 1) * page_size, page_size)
 
         return {
             "data": paginated_results,
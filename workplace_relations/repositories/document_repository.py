@@ -2,9 +2,10 @@
 Document repository interface for document data access operations.
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from workplace_relations.core import Document
+from collections import Counter
+from typing import Iterable, List, Optional, Dict, Any
+from datetime import datetime, time, timedelta
+from workplace_relations.core import DateUtils, Document
 from .base_repository import BaseRepository
 
 
@@ -20,9 +21,9 @@ class DocumentRepository(BaseRepository[Document]):
 
     def find_by_date_range(
         self, start_date: datetime, end_date: datetime
-    ) -> List[Document]:
-        """Find documents within a date range."""
-        return self.find_by_date_range("published_date", start_date, end_date)
+    ) -> Iterable[Document]:
+        """Find documents within a date range on the published_dt datetime."""
+        return super().find_by_date_range("published_dt", start_date, end_date)
 
     def find_by_file_type(self, file_type: str) -> List[Document]:
         """Find documents by file type."""
@@ -41,8 +42,15 @@ class DocumentRepository(BaseRepository[Document]):
         return self.find_by_field("partition_date", partition_date)
 
     def find_by_hash(self, file_hash: str) -> Optional[Document]:
-        """Find document by file hash."""
-        return self.find_by_field("file_hash", file_hash)
+        """
+        Find document by file hash.
+
+        Only the identifier, file_hash and file_path fields are loaded.
+        """
+        return self._find_one(
+            {"file_hash": file_hash},
+            {"_id": 0, "identifier": 1, "file_hash": 1, "file_path": 1},
+        )
 
     def find_duplicates(self) -> List[Document]:
         """Find documents with duplicate file hashes."""
@@ -52,53 +60,63 @@ class DocumentRepository(BaseRepository[Document]):
             "find_duplicates must be implemented in concrete repository"
         )
 
+    def aggregate_statistics(self) -> Dict[str, Any]:
+        """Compute document statistics in the data store."""
+        # Implemented by concrete repositories that can aggregate server-side
+        raise NotImplementedError(
+            "aggregate_statistics must be implemented in concrete repository"
+        )
+
     def get_document_statistics(self) -> Dict[str, Any]:
         """Get document statistics."""
-        all_documents = self.find_all()
-
-        stats = {
-            "total_documents": len(all_documents),
-            "processed_documents": len(self.find_processed_documents()),
-            "unprocessed_documents": len(self.find_unprocessed_documents()),
-            "file_types": {},
-            "bodies": {},
-            "date_range": {"earliest": None, "latest": None},
+        try:
+            return self.aggregate_statistics()
+        except NotImplementedError:
+            return self._stream_statistics()
+
+    def _stream_statistics(self) -> Dict[str, Any]:
+        """Compute document statistics by streaming every document."""
+        # Count in Python, keeping the running totals in locals rather than
+        # the output dict
+        total = processed = 0
+        file_types: Counter = Counter()
+        bodies: Counter = Counter()
+        earliest = latest = None
+
+        for doc in self.find_all():
+            total += 1
+            if doc.is_processed():
+                processed += 1
+            file_types[doc.file_type or "unknown"] += 1
+            bodies[doc.body or "unknown"] += 1
+
+            # Track date range, using the datetime stored at ingest when present
+            date_obj = doc.published_dt
+            if date_obj is None:
+                parsed = DateUtils.parse_date(doc.published_date, "%d/%m/%Y")
+                if parsed is None:
+                    continue
+                date_obj = datetime.combine(parsed, time.min)
+            if earliest is None or date_obj < earliest:
+                earliest = date_obj
+            if latest is None or date_obj > latest:
+                latest = date_obj
+
+        return {
+            "total_documents": total,
+            "processed_documents": processed,
+            "unprocessed_documents": total - processed,
+            "file_types": dict(file_types),
+            "bodies": dict(bodies),
+            "date_range": {"earliest": earliest, "latest": latest},
         }
 
-        for doc in all_documents:
-            # Count file types
-            file_type = doc.file_type or "unknown"
-            stats["file_types"][file_type] = stats["file_types"].get(file_type, 0) + 1
-
-            # Count bodies
-            body = doc.body or "unknown"
-            stats["bodies"][body] = stats["bodies"].get(body, 0) + 1
-
-            # Track date range
-            if doc.published_date:
-                try:
-                    date_obj = datetime.strptime(doc.published_date, "%d/%m/%Y")
-                    if (
-                        not stats["date_range"]["earliest"]
-                        or date_obj < stats["date_range"]["earliest"]
-                    ):
-                        stats["date_range"]["earliest"] = date_obj
-                    if (
-                        not stats["date_range"]["latest"]
-                        or date_obj > stats["date_range"]["latest"]
-                    ):
-                        stats["date_range"]["latest"] = date_obj
-                except ValueError:
-                    pass
-
-        return stats
-
     def find_by_processing_version(self, version: str) -> List[Document]:
         """Find documents by processing version."""
         return self.find_by_field("processing_version", version)
 
-    def find_recent_documents(self, days: int = 30) -> List[Document]:
+    def find_recent_documents(self, days: int = 30) -> Iterable[Document]:
         """Find documents from the last N days."""
         end_date = datetime.now()
-        start_date = end_date - datetime.timedelta(days=days)
+        start_date = end_date - timedelta(days=days)
         return self.find_by_date_range(start_date, end_date)
@@ -2,23 +2,106 @@
 MongoDB implementation of the document repository.
 """
 
-from typing import List, Optional, Dict, Any
+import atexit
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, time, date
-from pymongo import MongoClient
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+    DeleteMany,
+    IndexModel,
+    MongoClient,
+    ReplaceOne,
+    UpdateOne,
+)
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
 from pymongo.collection import Collection
 from pymongo.database import Database
 
-from workplace_relations.core import Document
+from workplace_relations.core import DateUtils, Document
 from .document_repository import DocumentRepository
 from workplace_relations.config import settings, get_logger
 
 logger = get_logger(__name__)
 
+# Only the fields the Document model consumes are fetched
+_DOCUMENT_PROJECTION = {"_id": 0, **{f.name: 1 for f in fields(Document)}}
+
+# Indexes backing the repository lookups and the published date range query,
+# besides the identifier index (see MongoRepository.ensure_indexes). file_hash
+# is not unique: the same file can be published under several identifiers.
+_DOCUMENT_INDEXES = [
+    IndexModel([("published_dt", ASCENDING), ("body", ASCENDING)]),
+    IndexModel([("file_hash", ASCENDING)]),
+    IndexModel([("link_to_doc", ASCENDING)]),
+    IndexModel([("partition_date", ASCENDING), ("body", ASCENDING)]),
+    IndexModel([("body", ASCENDING)]),
+    IndexModel([("file_type", ASCENDING)]),
+    IndexModel([("processing_version", ASCENDING)]),
+    IndexModel([("original_file_path", ASCENDING)], sparse=True),
+]
+
+# Duplicate values looked up per $in query in find_duplicates
+_DUPLICATE_VALUES_PER_QUERY = 1000
+
+# Documents remembered per repository for partial updates
+_LAST_SEEN_LIMIT = 10_000
+
+# One client per URI for the whole process; each client owns a connection
+# pool and server monitoring threads, so creating them per use is costly
+_clients: Dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_mongo_client(uri: Optional[str] = None) -> MongoClient:
+    """
+    Get the process-wide MongoDB client for a URI.
+
+    The shared client must not be closed by callers.
+
+    Args:
+        uri: MongoDB connection URI (defaults to the configured URI)
+
+    Returns:
+        Shared MongoClient instance
+    """
+    uri = uri or settings.MONGO_URI
+    with _clients_lock:
+        client = _clients.get(uri)
+        if client is None:
+            options: Dict[str, Any] = {
+                "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+                "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+                "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+            }
+            if settings.MONGO_COMPRESSORS:
+                options["compressors"] = settings.MONGO_COMPRESSORS
+            client = MongoClient(uri, **options)
+            _clients[uri] = client
+        return client
+
+
+@atexit.register
+def _close_mongo_clients() -> None:
+    """Close the shared clients when the process exits."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
 
 class MongoRepository(DocumentRepository):
     """
     MongoDB implementation of the document repository.
     Implements the Repository pattern for MongoDB.
+
+    The underlying client is shared process-wide and lives until the process
+    exits. Use the repository as a context manager (or call close()) to
+    release it deterministically; this leaves the shared pool open.
     """
 
     def __init__(self, collection_name: str = "landing_zone"):
@@ -27,12 +110,15 @@ class MongoRepository(DocumentRepository):
         self.database: Optional[Database] = None
         self.collection: Optional[Collection] = None
         self.collection_name = collection_name
+        # Field values last read by find_by_id, so update() can send only the
+        # fields that changed; bounded LRU keyed by identifier
+        self._last_seen: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._connect()
 
     def _connect(self):
         """Establish connection to MongoDB."""
         try:
-            self.client = MongoClient(self.mongo_config["uri"])
+            self.client = get_mongo_client(self.mongo_config["uri"])
             self.database = self.client[self.mongo_config["database"]]
             self.collection = self.database[self.collection_name]
             logger.info(f"Connected to MongoDB collection: {self.collection_name}")
@@ -40,14 +126,18 @@ class MongoRepository(DocumentRepository):
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise
 
-    def _disconnect(self):
-        """Close MongoDB connection."""
-        try:
-            if self.client:
-                self.client.close()
-                logger.info("Closed MongoDB connection")
-        except Exception as e:
-            logger.error(f"Error closing MongoDB connection: {e}")
+    def close(self):
+        """Release this repository's handles; the shared client stays open."""
+        self.collection = None
+        self.database = None
+        self.client = None
+        self._last_seen.clear()
+
+    def __enter__(self) -> "MongoRepository":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def create(self, entity: Document) -> Document:
         """Create a new document."""
@@ -62,39 +152,328 @@ class MongoRepository(DocumentRepository):
             logger.error(f"Failed to create document {entity.identifier}: {e}")
             raise
 
+    def create_many(self, entities: List[Document], batch_size: int = 1000) -> int:
+        """
+        Insert documents in unordered batches.
+
+        Batches keep each request under the server's message size limit, and
+        failed writes (such as duplicate identifiers) are logged without
+        aborting the remaining inserts.
+
+        Returns:
+            Number of documents inserted
+        """
+        inserted = 0
+        for start in range(0, len(entities), batch_size):
+            batch = [
+                entity.to_dict() for entity in entities[start : start + batch_size]
+            ]
+            try:
+                result = self.collection.insert_many(batch, ordered=False)
+                inserted += len(result.inserted_ids)
+            except BulkWriteError as e:
+                inserted += e.details.get("nInserted", 0)
+                for error in e.details.get("writeErrors", []):
+                    logger.warning(
+                        f"Failed to insert document at batch index {error.get('index')}: "
+                        f"{error.get('errmsg')}"
+                    )
+        logger.info(f"Created {inserted} documents in {self.collection_name}")
+        return inserted
+
+    def upsert_many(
+        self, entities: List[Document], batch_size: int = 1000
+    ) -> Tuple[int, int]:
+        """
+        Write documents keyed on identifier in unordered batches.
+
+        Existing documents with the same identifier are replaced, so writing
+        the same documents again is idempotent.
+
+        Returns:
+            Number of documents inserted and number replaced
+        """
+        inserted = replaced = 0
+        for start in range(0, len(entities), batch_size):
+            requests = [
+                ReplaceOne(
+                    {"identifier": entity.identifier}, entity.to_dict(), upsert=True
+                )
+                for entity in entities[start : start + batch_size]
+            ]
+            try:
+                result = self.collection.bulk_write(requests, ordered=False)
+                inserted += result.upserted_count
+                replaced += result.matched_count
+            except BulkWriteError as e:
+                inserted += e.details.get("nUpserted", 0)
+                replaced += e.details.get("nMatched", 0)
+                for error in e.details.get("writeErrors", []):
+                    logger.warning(
+                        f"Failed to write document at batch index {error.get('index')}: "
+                        f"{error.get('errmsg')}"
+                    )
+        logger.info(
+            f"Inserted {inserted} and replaced {replaced} documents "
+            f"in {self.collection_name}"
+        )
+        return inserted, replaced
+
+    def remove_duplicate_identifiers(self) -> int:
+        """
+        Delete all but the most recently written document per identifier.
+
+        Run before ensure_unique_identifier_index on a collection that may
+        hold duplicates written before the index existed.
+
+        Returns:
+            Number of documents deleted
+        """
+        pipeline = [
+            {"$sort": {"_id": DESCENDING}},
+            {
+                "$group": {
+                    "_id": "$identifier",
+                    "keep": {"$first": "$_id"},
+                    "count": {"$sum": 1},
+                }
+            },
+            {"$match": {"count": {"$gt": 1}}},
+        ]
+        requests = [
+            DeleteMany({"identifier": group["_id"], "_id": {"$ne": group["keep"]}})
+            for group in self.collection.aggregate(pipeline, allowDiskUse=True)
+        ]
+        if not requests:
+            return 0
+        result = self.collection.bulk_write(requests, ordered=False)
+        logger.info(
+            f"Deleted {result.deleted_count} duplicate documents "
+            f"from {self.collection_name}"
+        )
+        return result.deleted_count
+
+    def ensure_unique_identifier_index(self, remove_duplicates: bool = False) -> None:
+        """
+        Make identifiers unique so repeated writes are idempotent.
+
+        A non-unique identifier index left by earlier versions is replaced.
+        Raises if the index can't be built, e.g. because the collection
+        still holds duplicate identifiers.
+
+        Args:
+            remove_duplicates: If the unique index doesn't exist yet, first
+                delete duplicates with remove_duplicate_identifiers
+        """
+        for info in self.collection.index_information().values():
+            if info.get("unique") and [key for key, _ in info["key"]] == ["identifier"]:
+                return
+        if remove_duplicates:
+            self.remove_duplicate_identifiers()
+        try:
+            self.collection.create_index("identifier", unique=True)
+        except OperationFailure as e:
+            # 85/86: an identifier index exists with other options
+            if e.code not in (85, 86):
+                logger.error(f"Failed to create unique identifier index: {e}")
+                raise
+            self.collection.drop_index([("identifier", ASCENDING)])
+            self.collection.create_index("identifier", unique=True)
+
+    def backfill_published_dt(self, batch_size: int = 1000) -> int:
+        """
+        Store published_dt on documents written before the field existed.
+
+        Once backfilled, date range queries are served by the published_dt
+        index alone instead of parsing the legacy published_date strings.
+        Documents whose date can't be parsed are flagged with
+        published_dt_unparseable so later backfills skip them.
+
+        Returns:
+            Number of documents updated
+        """
+        updated = 0
+        requests: List[UpdateOne] = []
+        try:
+            cursor = self.collection.find(
+                {
+                    "published_dt": None,
+                    "published_date": {"$type": "string"},
+                    "published_dt_unparseable": {"$ne": True},
+                },
+                {"published_date": 1},
+                batch_size=batch_size,
+            )
+            for document_dict in cursor:
+                parsed = DateUtils.parse_date(
+                    document_dict["published_date"], settings.DATE_FORMAT_DISPLAY
+                )
+                if parsed is None:
+                    update = {"published_dt_unparseable": True}
+                else:
+                    update = {"published_dt": datetime.combine(parsed, time.min)}
+                requests.append(
+                    UpdateOne({"_id": document_dict["_id"]}, {"$set": update})
+                )
+                if len(requests) >= batch_size:
+                    updated += self.collection.bulk_write(
+                        requests, ordered=False
+                    ).modified_count
+                    requests = []
+            if requests:
+                updated += self.collection.bulk_write(
+                    requests, ordered=False
+                ).modified_count
+        except Exception as e:
+            logger.error(f"Failed to backfill published_dt: {e}")
+        if updated:
+            logger.info(f"Backfilled or flagged published_dt on {updated} documents")
+        return updated
+
+    def ensure_indexes(
+        self, unique_identifier: bool = False, remove_duplicates: bool = False
+    ) -> None:
+        """
+        Create the indexes used by the repository lookups.
+
+        Args:
+            unique_identifier: Make the identifier index unique. The landing
+                collection can hold several copies of an identifier; the
+                processed collection holds one.
+            remove_duplicates: Delete duplicate identifiers before creating
+                the unique index (see ensure_unique_identifier_index)
+        """
+        if unique_identifier:
+            self.ensure_unique_identifier_index(remove_duplicates)
+        else:
+            try:
+                self.collection.create_index("identifier")
+            except Exception as e:
+                logger.warning(f"Failed to create identifier index: {e}")
+        try:
+            self.collection.create_indexes(_DOCUMENT_INDEXES)
+        except Exception as e:
+            logger.warning(f"Failed to create indexes: {e}")
+
+    def drop_secondary_indexes(self) -> None:
+        """
+        Drop all indexes except _id and identifier, e.g. ahead of a large
+        bulk load. The identifier index stays because writes are keyed on it.
+        """
+        try:
+            for name, info in self.collection.index_information().items():
+                keys = [key for key, _ in info["key"]]
+                if name != "_id_" and keys != ["identifier"]:
+                    self.collection.drop_index(name)
+        except Exception as e:
+            logger.warning(f"Failed to drop indexes: {e}")
+
     def find_by_id(self, entity_id: str) -> Optional[Document]:
         """Find document by identifier."""
         try:
-            document_dict = self.collection.find_one({"identifier": entity_id})
+            document_dict = self.collection.find_one(
+                {"identifier": entity_id}, _DOCUMENT_PROJECTION
+            )
             if document_dict:
+                self._remember(entity_id, document_dict)
                 return Document.from_dict(document_dict)
             return None
         except Exception as e:
             logger.error(f"Failed to find document by ID {entity_id}: {e}")
             return None
 
-    def find_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
-        """Find all documents with optional filters."""
+    def _remember(self, entity_id: str, document_dict: Dict[str, Any]) -> None:
+        """Record the stored field values of a document."""
+        self._last_seen[entity_id] = document_dict
+        self._last_seen.move_to_end(entity_id)
+        if len(self._last_seen) > _LAST_SEEN_LIMIT:
+            self._last_seen.popitem(last=False)
+
+    def _find_one(
+        self, filters: Dict[str, Any], projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Document]:
+        """Find the first document matching filters."""
+        try:
+            document_dict = self.collection.find_one(
+                filters, projection or _DOCUMENT_PROJECTION
+            )
+            if document_dict:
+                return Document.from_dict(document_dict)
+            return None
+        except Exception as e:
+            logger.error(f"Failed to find document: {e}")
+            return None
+
+    def find_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Document]:
+        """
+        Find all documents with optional filters, yielded from the cursor.
+
+        batch_size (default MONGO_CURSOR_BATCH_SIZE) bounds how many documents
+        are buffered per round trip: smaller uses less memory, larger fewer
+        round trips.
+        """
         try:
             query = filters or {}
-            cursor = self.collection.find(query)
-            documents = []
+            cursor = self.collection.find(
+                query,
+                _DOCUMENT_PROJECTION,
+                batch_size=batch_size or settings.MONGO_CURSOR_BATCH_SIZE,
+            )
             for document_dict in cursor:
-                document_dict.pop("_id", None)  # Remove MongoDB's _id field
-                documents.append(Document.from_dict(document_dict))
-            return documents
+                yield Document._from_raw(document_dict)
         except Exception as e:
+            # Re-raise so a failure mid-iteration can't pass for the end of
+            # the results
             logger.error(f"Failed to find documents: {e}")
+            raise
+
+    def _find_page(
+        self, filters: Optional[Dict[str, Any]], skip: int, limit: int
+    ) -> List[Document]:
+        """Find one page of documents, ordered by _id so pages don't overlap."""
+        try:
+            cursor = (
+                self.collection.find(filters or {}, _DOCUMENT_PROJECTION)
+                .sort("_id", ASCENDING)
+                .skip(skip)
+                .limit(limit)
+            )
+            return [Document._from_raw(document_dict) for document_dict in cursor]
+        except Exception as e:
+            logger.error(f"Failed to find page of documents: {e}")
             return []
 
     def update(self, entity: Document) -> Document:
-        """Update an existing document."""
+        """
+        Update an existing document.
+
+        Only fields that differ from the last find_by_id result are sent;
+        without one, every field is set.
+        """
         try:
             document_dict = entity.to_dict()
-            result = self.collection.replace_one(
-                {"identifier": entity.identifier}, document_dict
+            stored = self._last_seen.pop(entity.identifier, None)
+            if stored is None:
+                changes = document_dict
+            else:
+                changes = {
+                    key: value
+                    for key, value in document_dict.items()
+                    if stored.get(key) != value
+                }
+                if not changes:
+                    self._remember(entity.identifier, document_dict)
+                    return entity
+
+            result = self.collection.update_one(
+                {"identifier": entity.identifier}, {"$set": changes}
             )
-            if result.modified_count > 0:
+            if result.matched_count > 0:
+                self._remember(entity.identifier, document_dict)
                 logger.info(f"Updated document {entity.identifier}")
             else:
                 logger.warning(f"No document found to update: {entity.identifier}")
@@ -105,6 +484,7 @@ class MongoRepository(DocumentRepository):
 
     def delete(self, entity_id: str) -> bool:
         """Delete document by identifier."""
+        self._last_seen.pop(entity_id, None)
         try:
             result = self.collection.delete_one({"identifier": entity_id})
             if result.deleted_count > 0:
@@ -120,57 +500,213 @@ class MongoRepository(DocumentRepository):
     def exists(self, entity_id: str) -> bool:
         """Check if document exists."""
         try:
-            count = self.collection.count_documents({"identifier": entity_id})
-            return count > 0
+            # Projecting only the indexed field lets the index cover the query
+            document_dict = self.collection.find_one(
+                {"identifier": entity_id}, {"_id": 0, "identifier": 1}
+            )
+            return document_dict is not None
         except Exception as e:
             logger.error(f"Failed to check existence of document {entity_id}: {e}")
             return False
 
+    def exists_by_field(self, field: str, value: Any) -> bool:
+        """Check if any document has the given field value."""
+        try:
+            return self.collection.count_documents({field: value}, limit=1) > 0
+        except Exception as e:
+            logger.error(f"Failed to check existence of {field}={value}: {e}")
+            return False
+
+    def find_field_values(
+        self,
+        field: str,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Yield one field's value from every document matching filters.
+
+        Only the field is fetched, and values stream from the cursor rather
+        than being collected server-side like distinct(), whose result is
+        capped at the 16 MB document limit.
+        """
+        try:
+            cursor = self.collection.find(
+                filters or {},
+                {"_id": 0, field: 1},
+                batch_size=batch_size or settings.MONGO_CURSOR_BATCH_SIZE,
+            )
+            for document_dict in cursor:
+                yield document_dict.get(field)
+        except Exception as e:
+            logger.error(f"Failed to find {field} values: {e}")
+            raise
+
+    def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count documents with optional filters.
+
+        An unfiltered count reads the collection metadata instead of scanning.
+        """
+        try:
+            if not filters:
+                return self.collection.estimated_document_count()
+            return self.collection.count_documents(filters)
+        except Exception as e:
+            logger.error(f"Failed to count documents: {e}")
+            return 0
+
     def find_by_date_range(
-        self, start_date: datetime, end_date: datetime
-    ) -> List[Document]:
-        """Find documents within a date range using MongoDB aggregation."""
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Document]:
+        """
+        Find documents within a date range.
+
+        Uses the indexed published_dt field; documents stored before that
+        field existed fall back to parsing their published_date string.
+        Documents are yielded as the cursor returns them rather than
+        collected into a list, batch_size (default MONGO_CURSOR_BATCH_SIZE)
+        at a time.
+        """
         start_dt = self._to_datetime(start_date)
         end_dt = self._to_datetime(end_date)
         try:
-            pipeline = [
-                {
-                    "$addFields": {
-                        "parsed_date": {
-                            "$dateFromString": {
-                                "dateString": "$published_date",
-                                "format": "%d/%m/%Y",
+            query = {
+                "$or": [
+                    {"published_dt": {"$gte": start_dt, "$lte": end_dt}},
+                    {
+                        "published_dt": None,
+                        "$expr": {
+                            "$let": {
+                                "vars": {
+                                    "parsed_date": {
+                                        "$dateFromString": {
+                                            "dateString": "$published_date",
+                                            "format": "%d/%m/%Y",
+                                            "onError": None,
+                                            "onNull": None,
+                                        }
+                                    }
+                                },
+                                "in": {
+                                    "$and": [
+                                        {"$gte": ["$$parsed_date", start_dt]},
+                                        {"$lte": ["$$parsed_date", end_dt]},
+                                    ]
+                                },
                             }
-                        }
-                    }
-                },
-                {"$match": {"parsed_date": {"$gte": start_dt, "$lte": end_dt}}},
+                        },
+                    },
+                ]
+            }
+
+            cursor = self.collection.find(
+                query,
+                _DOCUMENT_PROJECTION,
+                batch_size=batch_size or settings.MONGO_CURSOR_BATCH_SIZE,
+            )
+            for document_dict in cursor:
+                yield Document._from_raw(document_dict)
+        except Exception as e:
+            # Re-raise so a failure mid-iteration can't pass for the end of
+            # the results
+            logger.error(f"Failed to find documents by date range: {e}")
+            raise
+
+    def aggregate_statistics(self) -> Dict[str, Any]:
+        """
+        Compute document statistics in one server-side aggregation.
+
+        Only the bucket counts and the date bounds are returned, rather than
+        every document.
+        """
+        published = {
+            "$ifNull": [
+                "$published_dt",
                 {
-                    "$project": {
-                        "parsed_date": 0  # Exclude the parsed_date field from results
+                    "$dateFromString": {
+                        "dateString": "$published_date",
+                        "format": "%d/%m/%Y",
+                        "onError": None,
+                        "onNull": None,
                     }
                 },
             ]
+        }
+        pipeline = [
+            {
+                "$facet": {
+                    "total": [{"$count": "n"}],
+                    "processed": [
+                        {"$match": {"original_file_path": {"$ne": None}}},
+                        {"$count": "n"},
+                    ],
+                    "file_types": [
+                        {
+                            "$group": {
+                                "_id": {"$ifNull": ["$file_type", "unknown"]},
+                                "n": {"$sum": 1},
+                            }
+                        }
+                    ],
+                    "bodies": [
+                        {
+                            "$group": {
+                                "_id": {"$ifNull": ["$body", "unknown"]},
+                                "n": {"$sum": 1},
+                            }
+                        }
+                    ],
+                    "date_range": [
+                        {
+                            "$group": {
+                                "_id": None,
+                                "earliest": {"$min": published},
+                                "latest": {"$max": published},
+                            }
+                        }
+                    ],
+                }
+            }
+        ]
+        try:
+            result = next(self.collection.aggregate(pipeline))
+        except PyMongoError as e:
+            logger.error(f"Failed to aggregate document statistics: {e}")
+            return self._stream_statistics()
 
-            cursor = self.collection.aggregate(pipeline)
-            documents = []
-            for document_dict in cursor:
-                document_dict.pop("_id", None)  # Remove MongoDB's _id field
-                document_dict.pop(
-                    "parsed_date", None
-                )  # Also remove parsed_date if it exists
-                documents.append(Document.from_dict(document_dict))
-
-            return documents
-        except Exception as e:
-            logger.error(f"Failed to find documents by date range: {e}")
-            return []
+        total = result["total"][0]["n"] if result["total"] else 0
+        processed = result["processed"][0]["n"] if result["processed"] else 0
+        date_range = result["date_range"][0] if result["date_range"] else {}
+        return {
+            "total_documents": total,
+            "processed_documents": processed,
+            "unprocessed_documents": total - processed,
+            "file_types": {group["_id"]: group["n"] for group in result["file_types"]},
+            "bodies": {group["_id"]: group["n"] for group in result["bodies"]},
+            "date_range": {
+                "earliest": date_range.get("earliest"),
+                "latest": date_range.get("latest"),
+            },
+        }
 
-    def find_duplicates(self, field: str = "identifier") -> List[Dict[str, Any]]:
+    def find_duplicates(
+        self,
+        field: str = "identifier",
+        batch_size: Optional[int] = None,
+        sample_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """Find documents with duplicate field values (default: identifier).
 
         Args:
             field: Field name to check for duplicates
+            batch_size: Documents fetched per cursor round trip
+                (default MONGO_CURSOR_BATCH_SIZE)
+            sample_size: If given, return at most this many documents per
+                group, collected in the grouping query itself
 
         Returns:
             List of dictionaries containing:
@@ -178,46 +714,95 @@ class MongoRepository(DocumentRepository):
             - count: Number of duplicates
             - documents: List of duplicate documents
         """
+        if sample_size:
+            return self._find_duplicate_samples(field, sample_size)
+
+        try:
+            # Group on the server by count only, so no group has to hold its
+            # documents (a single result is capped at 16 MiB)
+            pipeline = [
+                {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+                {"$match": {"count": {"$gt": 1}}},
+            ]
+            groups: Dict[Any, Dict[str, Any]] = {}
+            for group in self.collection.aggregate(pipeline, allowDiskUse=True):
+                groups[group["_id"]] = {
+                    "field_value": group["_id"],
+                    "count": group["count"],
+                    "documents": [],
+                }
+
+            # Then stream the duplicated documents in chunks of values
+            values = list(groups)
+            projection = {**_DOCUMENT_PROJECTION, field: 1}
+            model_field = field in _DOCUMENT_PROJECTION
+            for start in range(0, len(values), _DUPLICATE_VALUES_PER_QUERY):
+                chunk = values[start : start + _DUPLICATE_VALUES_PER_QUERY]
+                cursor = self.collection.find(
+                    {field: {"$in": chunk}},
+                    projection,
+                    batch_size=batch_size or settings.MONGO_CURSOR_BATCH_SIZE,
+                )
+                for document_dict in cursor:
+                    if model_field:
+                        value = document_dict.get(field)
+                    else:
+                        value = document_dict.pop(field, None)
+                    group = groups.get(value)
+                    if group is not None:
+                        group["documents"].append(Document._from_raw(document_dict))
+
+            return list(groups.values())
+
+        except Exception as e:
+            logger.error(f"Failed to find duplicates by {field}: {e}")
+            return []
+
+    def _find_duplicate_samples(
+        self, field: str, sample_size: int
+    ) -> List[Dict[str, Any]]:
+        """Find duplicate groups with a bounded sample of documents each."""
         try:
+            # Oldest documents first; only model fields are shipped back.
+            # $push + $slice rather than $topN, which needs MongoDB 5.2+
             pipeline = [
+                {"$sort": {"_id": 1}},
                 {
                     "$group": {
                         "_id": f"${field}",
                         "count": {"$sum": 1},
-                        "documents": {"$push": "$$ROOT"},
+                        "samples": {
+                            "$push": {
+                                name: f"${name}"
+                                for name in _DOCUMENT_PROJECTION
+                                if name != "_id"
+                            }
+                        },
                     }
                 },
                 {"$match": {"count": {"$gt": 1}}},
-            ]
-
-            duplicates = []
-            cursor = self.collection.aggregate(pipeline)
-
-            for group in cursor:
-                # Convert MongoDB documents to our Document model
-                doc_list = []
-                for doc in group["documents"]:
-                    doc.pop("_id", None)
-                    doc_list.append(Document.from_dict(doc))
-
-                duplicates.append(
-                    {
-                        "field_value": group["_id"],
-                        "count": group["count"],
-                        "documents": doc_list,
+                {
+                    "$project": {
+                        "count": 1,
+                        "samples": {"$slice": ["$samples", sample_size]},
                     }
-                )
-
-            return duplicates
+                },
+            ]
+            return [
+                {
+                    "field_value": group["_id"],
+                    "count": group["count"],
+                    "documents": [
+                        Document.from_dict(sample) for sample in group["samples"]
+                    ],
+                }
+                for group in self.collection.aggregate(pipeline, allowDiskUse=True)
+            ]
 
         except Exception as e:
             logger.error(f"Failed to find duplicates by {field}: {e}")
             return []
 
-    def __del__(self):
-        """Cleanup on object destruction."""
-        self._disconnect()
-
     def _to_datetime(self, dt):
         if isinstance(dt, datetime):
             return dt
@@ -5,8 +5,8 @@ Dagster resources for Scrapy and MongoDB.
 from dagster import resource
 from scrapy.crawler import CrawlerProcess
 from scrapy.utils.project import get_project_settings
-from pymongo import MongoClient
 from workplace_relations.config import settings
+from workplace_relations.repositories import get_mongo_client
 
 
 @resource
@@ -26,4 +26,4 @@ def scrapy_runner_resource(init_context):
 @resource
 def mongo_resource(init_context):
     """Dagster resource for MongoDB client using centralized config."""
-    return MongoClient(settings.MONGO_URI)
+    return get_mongo_client(settings.MONGO_URI)
@@ -3,20 +3,68 @@ Scrapy spider for workplace relations document crawling.
 Uses centralized config, logging, and utility modules.
 """
 
+import lxml.etree
 import scrapy
-from urllib.parse import urlencode, urlparse
-from typing import Optional
+from urllib.parse import quote_plus, urlencode
+from typing import Optional, Tuple
 
-from workplace_relations.items import WorkplaceRelationsItem
+from workplace_relations.items import WorkplaceRelationsRecord
 from workplace_relations.config import settings, get_logger
 from workplace_relations.core import (
     ScraperMonitor,
     SpiderConfig,
     DateUtils,
 )
+from workplace_relations.core.utils import FileUtils
 
 logger = get_logger(__name__)
 
+# XPath expressions, compiled once rather than on every page and result
+_BODY_CELL_XPATH = lxml.etree.XPath("//table[@id='CB2']//tr/td[input]")
+_BODY_ID_XPATH = lxml.etree.XPath("./input/@value", smart_strings=False)
+_BODY_NAME_XPATH = lxml.etree.XPath("./label/text()", smart_strings=False)
+_RESULTS_XPATH = lxml.etree.XPath("//div[@class='item-list search-list']//li")
+_NEXT_PAGE_XPATH = lxml.etree.XPath("//a[@class='next']/@href", smart_strings=False)
+
+
+def _first(xpath: lxml.etree.XPath, element) -> Optional[str]:
+    """Return the first result of a compiled XPath, like Selector.get()."""
+    results = xpath(element)
+    return results[0] if results else None
+
+
+def _parse_result(
+    element,
+) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """
+    Extract (identifier, link, description, published_date) from a result.
+
+    Walks the result's subtree once, keeping the first match for each field:
+    the first titled <h2>, an <a> directly inside a div whose class contains
+    "link", a direct <p class="description"> child and <span class="date">.
+    """
+    identifier = link = description = published_date = None
+    for node in element.iter("h2", "a", "p", "span"):
+        tag = node.tag
+        if tag == "h2":
+            if identifier is None:
+                identifier = node.get("title")
+        elif tag == "a":
+            if link is None:
+                parent = node.getparent()
+                if parent.tag == "div" and "link" in (parent.get("class") or ""):
+                    link = node.get("href")
+        elif tag == "p":
+            if (
+                description is None
+                and node.get("class") == "description"
+                and node.getparent() is element
+            ):
+                description = node.get("title")
+        elif published_date is None and node.get("class") == "date":
+            published_date = node.text
+    return identifier, link, description, published_date
+
 
 class WorkplaceSpider(scrapy.Spider):
     """
@@ -75,40 +123,55 @@ class WorkplaceSpider(scrapy.Spider):
             logger.error(f"Failed to fetch body list: HTTP {response.status}")
             return
 
-        body_ids = response.xpath("//table[@id='CB2']//tr/td/input/@value").getall()
-        body_names = response.xpath("//table[@id='CB2']//tr/td/label/text()").getall()
-        bodies = list(zip(body_names, body_ids))
+        # Read each checkbox cell once so a name always pairs with its own id
+        bodies = []
+        for cell in _BODY_CELL_XPATH(response.selector.root):
+            body_id = _first(_BODY_ID_XPATH, cell)
+            body_name = _first(_BODY_NAME_XPATH, cell)
+            if body_id and body_name:
+                bodies.append((body_name, body_id))
 
         logger.info(f"Found {len(bodies)} bodies for processing")
 
+        # The monthly query strings don't depend on the body, so build them
+        # once and only append the body id per request
+        months = [
+            (
+                urlencode(
+                    {
+                        "decisions": 1,
+                        "from": range_start.strftime("%d/%m/%Y"),
+                        "to": range_end.strftime("%d/%m/%Y"),
+                    }
+                ),
+                range_start.strftime("%Y-%m"),
+            )
+            for range_start, range_end in DateUtils.get_monthly_ranges(
+                self.config.start_date, self.config.end_date
+            )
+        ]
+
         for body_name, body_id in bodies:
             body_name_clean = body_name.strip().lower()
             if self.selected_bodies and body_name_clean not in self.selected_bodies:
                 continue
 
             logger.debug(f"Processing body: {body_name} (ID: {body_id})")
+            body_param = quote_plus(body_id)
 
-            for range_start, range_end in DateUtils.get_monthly_ranges(
-                self.config.start_date, self.config.end_date
-            ):
+            for month_query, partition_date in months:
                 if self.document_count >= self.MAX_DOCUMENTS:
                     logger.info(
                         f"Reached document limit of {self.MAX_DOCUMENTS}, stopping"
                     )
                     return
 
-                params = {
-                    "decisions": 1,
-                    "from": range_start.strftime("%d/%m/%Y"),
-                    "to": range_end.strftime("%d/%m/%Y"),
-                    "Body": body_id,
-                }
-                url = f"{self.start_url}?{urlencode(params)}"
+                url = f"{self.start_url}?{month_query}&Body={body_param}"
                 yield scrapy.Request(
                     url=url,
                     callback=self.parse_results,
                     meta={
-                        "partition_date": range_start.strftime("%Y-%m"),
+                        "partition_date": partition_date,
                         "body": body_name,
                     },
                     errback=self.handle_error,
@@ -121,16 +184,28 @@ class WorkplaceSpider(scrapy.Spider):
             logger.warning(f"Failed search results page: HTTP {response.status}")
             return
 
-        items = response.xpath("//div[@class='item-list search-list']//li")
+        # Schedule the next page before parsing this one, so its download
+        # overlaps with item parsing; the item loop still enforces the limit
+        root = response.selector.root
+        next_page = _first(_NEXT_PAGE_XPATH, root)
+        if next_page and self.document_count < self.MAX_DOCUMENTS:
+            logger.debug("Following pagination")
+            yield response.follow(
+                next_page,
+                callback=self.parse_results,
+                meta=response.meta,
+                priority=10,
+            )
+
+        items = _RESULTS_XPATH(root)
         logger.debug(f"Found {len(items)} items on page {response.url}")
 
-        for item in items:
+        for element in items:
             if self.document_count >= self.MAX_DOCUMENTS:
                 logger.info(f"Reached document limit of {self.MAX_DOCUMENTS}, stopping")
                 return
 
-            identifier = item.xpath(".//h2/@title").get()
-            link = item.xpath(".//div[contains(@class, 'link')]/a/@href").get()
+            identifier, link, description, published_date = _parse_result(element)
 
             if not link:
                 logger.debug("Skipping item without link")
@@ -139,35 +214,20 @@ class WorkplaceSpider(scrapy.Spider):
             abs_url = response.urljoin(link)
             self.document_count += 1
 
-            # Determine file type from URL
-            parsed_url = urlparse(abs_url)
-            path = parsed_url.path.lower()
-            if path.endswith(".pdf"):
-                file_type = "pdf"
-            elif path.endswith(".doc") or path.endswith(".docx"):
-                file_type = "docx" if path.endswith(".docx") else "doc"
-            else:
-                file_type = "html"
+            # Determine file type from the URL's extension
+            file_type = FileUtils.get_file_extension(abs_url)
 
-            # Yield Scrapy Item (for pipeline compatibility)
-            yield WorkplaceRelationsItem(
+            # Yield item (read by the pipelines through ItemAdapter)
+            yield WorkplaceRelationsRecord(
                 identifier=identifier.strip() if identifier else None,
-                description=item.xpath("./p[@class='description']/@title").get(),
-                published_date=item.xpath(".//span[@class='date']/text()").get(),
+                description=description,
+                published_date=published_date,
                 partition_date=response.meta["partition_date"],
                 body=response.meta["body"],
                 link_to_doc=abs_url,
                 file_type=file_type,
             )
 
-        # Pagination
-        next_page = response.xpath("//a[@class='next']/@href").get()
-        if next_page and self.document_count < self.MAX_DOCUMENTS:
-            logger.debug("Following pagination")
-            yield response.follow(
-                next_page, callback=self.parse_results, meta=response.meta
-            )
-
     def closed(self, reason):
         """Called when the spider closes."""
         metrics = self.monitor.finalize()